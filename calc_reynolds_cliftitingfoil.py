@@ -11,6 +11,659 @@ bl_info = {
 }
 
 import bpy
+import contextlib
+import hashlib
+import os
+import time
+import numpy as np
+
+def _resample_half(points, count):
+    # Cosine spacing in arc length, so panels cluster at both ends of each surface
+    lengths = np.hypot(*np.diff(points, axis=0).T)
+    s = np.concatenate([[0.0], np.cumsum(lengths)])
+    targets = s[-1] * 0.5 * (1 - np.cos(np.linspace(0, np.pi, count)))
+    return np.stack([np.interp(targets, s, points[:, 0]), np.interp(targets, s, points[:, 1])], axis=-1)
+
+def panel_contour(x_coords, y_coords, panels=160):
+    # Orders a closed outline for the panel solver: clockwise from the lower trailing edge, round the
+    # leading edge, to the upper trailing edge; chord scaled to 1 and resampled to the requested panel count
+    points = np.stack([x_coords, y_coords], axis=-1).astype(np.float64)
+    keep = np.any(np.abs(np.diff(points, axis=0, append=points[:1])) > 1e-12, axis=1)
+    points = points[keep]
+    if len(points) < 4:
+        raise ValueError("Airfoil outline needs at least 4 distinct points")
+    x, y = points[:, 0], points[:, 1]
+    if np.dot(x, np.roll(y, -1)) - np.dot(y, np.roll(x, -1)) > 0:
+        points = points[::-1]
+    start = int(np.argmax(points[:, 0]))
+    step = points[(start + 1) % len(points)] - points[start]
+    if abs(step[1]) > abs(step[0]):
+        # The first panel would bridge a blunt trailing edge; start on the lower surface instead
+        start = (start + 1) % len(points)
+    points = np.roll(points, -start, axis=0)
+    if np.hypot(*(points[-1] - points[0])) < 1e-9 or abs(points[-1, 1] - points[0, 1]) < abs(points[-1, 0] - points[0, 0]):
+        points = np.concatenate([points, points[:1]])
+    
+    le = int(np.argmin(points[:, 0]))
+    chord = points[:, 0].max() - points[le, 0]
+    points = (points - points[le]) / chord
+    half = panels // 2 + 1
+    lower = _resample_half(points[:le + 1], half)
+    upper = _resample_half(points[le:], panels - half + 2)
+    contour = np.concatenate([lower, upper[1:]])
+    return contour[:, 0], contour[:, 1]
+
+class VortexPanelSolver:
+    # Linear-strength vortex panel method (Kuethe & Chow). The influence matrix depends only on the geometry,
+    # and the right-hand side is linear in (cos a, sin a), so the system is solved once for two basis
+    # right-hand sides and every angle of attack afterwards is a linear combination of those solutions
+    def __init__(self, x_coords, y_coords):
+        X, Y = np.asarray(x_coords, dtype=np.float64), np.asarray(y_coords, dtype=np.float64)
+        S = np.hypot(np.diff(X), np.diff(Y))
+        theta = np.arctan2(np.diff(Y), np.diff(X))
+        xc = 0.5 * (X[:-1] + X[1:])
+        yc = 0.5 * (Y[:-1] + Y[1:])
+        m = len(S)
+        
+        dx = xc[:, None] - X[None, :-1]
+        dy = yc[:, None] - Y[None, :-1]
+        ti, tj, Sj = theta[:, None], theta[None, :], S[None, :]
+        A = -dx * np.cos(tj) - dy * np.sin(tj)
+        B = dx**2 + dy**2
+        C = np.sin(ti - tj)
+        D = np.cos(ti - tj)
+        E = dx * np.sin(tj) - dy * np.cos(tj)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            F = np.log(1 + Sj * (Sj + 2 * A) / B)
+        G = np.arctan2(E * Sj, B + A * Sj)
+        P = dx * np.sin(ti - 2 * tj) + dy * np.cos(ti - 2 * tj)
+        Q = dx * np.cos(ti - 2 * tj) - dy * np.sin(ti - 2 * tj)
+        CN2 = D + 0.5 * Q * F / Sj - (A * C + D * E) * G / Sj
+        CN1 = 0.5 * D * F + C * G - CN2
+        CT2 = C + 0.5 * P * F / Sj + (A * D - C * E) * G / Sj
+        CT1 = 0.5 * C * F - D * G - CT2
+        diagonal = np.eye(m, dtype=bool)
+        CN1[diagonal], CN2[diagonal] = -1.0, 1.0
+        CT1[diagonal], CT2[diagonal] = 0.5 * np.pi, 0.5 * np.pi
+        
+        AN = np.zeros((m + 1, m + 1))
+        AT = np.zeros((m, m + 1))
+        AN[:m, :m] += CN1
+        AN[:m, 1:] += CN2
+        AT[:, :m] += CT1
+        AT[:, 1:] += CT2
+        # Kutta condition
+        AN[m, 0] = AN[m, m] = 1.0
+        
+        rhs = np.zeros((m + 1, 2))
+        rhs[:m, 0] = np.sin(theta)
+        rhs[:m, 1] = -np.cos(theta)
+        gamma = np.linalg.solve(AN, rhs)
+        # Surface speed basis: V(a) = cos(a) * v_cos + sin(a) * v_sin
+        self.v_cos = np.cos(theta) + AT @ gamma[:, 0]
+        self.v_sin = np.sin(theta) + AT @ gamma[:, 1]
+        # Panel force directions from the outward normals of the clockwise contour
+        self.fx = np.sin(theta) * S
+        self.fy = -np.cos(theta) * S
+        self.xc = xc
+        self.yc = yc
+        self.panels = m
+    
+    def polar(self, alphas):
+        # Returns (cl, cm about the quarter chord, nose up positive) for angles of attack in degrees
+        alpha = np.radians(np.atleast_1d(np.asarray(alphas, dtype=np.float64)))
+        speed = np.outer(np.cos(alpha), self.v_cos) + np.outer(np.sin(alpha), self.v_sin)
+        cp = 1 - speed**2
+        force_x = cp @ self.fx
+        force_y = cp @ self.fy
+        cl = force_y * np.cos(alpha) - force_x * np.sin(alpha)
+        cm = -(cp @ ((self.xc - 0.25) * self.fy - self.yc * self.fx))
+        return cl, cm
+
+def airfoil_outline_from_object(obj):
+    # Local X/Y of the mesh vertices, walked along the edge loop when the mesh has edges
+    mesh = obj.data
+    count = len(mesh.vertices)
+    if count < 4:
+        raise ValueError("'%s' has too few vertices for an airfoil outline" % obj.name)
+    co = np.empty(count * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    co = co.reshape(-1, 3).astype(np.float64)
+    if len(mesh.edges) >= count:
+        edges = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+        mesh.edges.foreach_get("vertices", edges)
+        neighbours = [[] for _ in range(count)]
+        for a, b in edges.reshape(-1, 2).tolist():
+            neighbours[a].append(b)
+            neighbours[b].append(a)
+        order = [0]
+        previous = -1
+        while len(order) < count:
+            following = [v for v in neighbours[order[-1]] if v != previous]
+            if not following or following[0] == order[0]:
+                break
+            previous = order[-1]
+            order.append(following[0])
+        co = co[order]
+    return co[:, 0], co[:, 1]
+
+def airfoil_outline(obj):
+    if obj is None or obj.type != 'MESH':
+        raise ValueError("Select an airfoil outline mesh")
+    return airfoil_outline_from_object(obj)
+
+POLAR_STORE_VERSION = 2
+
+def outline_hash(x_coords, y_coords):
+    digest = hashlib.sha1()
+    digest.update(np.ascontiguousarray(x_coords, dtype=np.float64).tobytes())
+    digest.update(np.ascontiguousarray(y_coords, dtype=np.float64).tobytes())
+    return digest.hexdigest()
+
+class PolarStore:
+    # Polars on disk, one (3, n) .npy of alpha/cl/cm rows per key. Reads are memory-mapped and only noted in
+    # memory, eviction past max_bytes drops the polars least recently read this session or written first
+    def __init__(self, directory=None, max_bytes=32 * 1024 * 1024):
+        self._directory = directory
+        self.max_bytes = max_bytes
+        self._last_read = {}
+    
+    @property
+    def directory(self):
+        if self._directory is None:
+            self._directory = bpy.utils.user_resource('DATAFILES', path="polar_cache", create=True)
+        return self._directory
+    
+    @staticmethod
+    def key(geometry_hash, settings):
+        text = "%d|%s|%s" % (POLAR_STORE_VERSION, geometry_hash, settings)
+        return hashlib.sha1(text.encode('utf-8')).hexdigest()
+    
+    def _path(self, key):
+        return os.path.join(self.directory, key + ".npy")
+    
+    def get(self, key):
+        path = self._path(key)
+        try:
+            polar = np.load(path, mmap_mode='r')
+        except (OSError, ValueError):
+            return None
+        self._last_read[path] = time.time()
+        return polar
+    
+    def put(self, key, alphas, cl, cm):
+        path = self._path(key)
+        tmp_path = path + ".tmp.npy"
+        np.save(tmp_path, np.stack([alphas, cl, cm]))
+        os.replace(tmp_path, path)
+        self.evict()
+        return np.load(path, mmap_mode='r')
+    
+    def evict(self):
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".npy") and not entry.name.endswith(".tmp.npy"):
+                stat = entry.stat()
+                entries.append((max(stat.st_mtime, self._last_read.get(entry.path, 0.0)), stat.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            self._last_read.pop(path, None)
+            total -= size
+    
+    def clear(self):
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".npy"):
+                os.remove(entry.path)
+        self._last_read.clear()
+
+polar_store = PolarStore()
+
+def compressibility_factor(mach):
+    # Prandtl-Glauert correction applied to the incompressible coefficients
+    return 1.0 / np.sqrt(1.0 - min(mach, 0.95) ** 2)
+
+def airfoil_polar(scene, obj):
+    # Returns (alpha, cl, cm, cached) for the scene's sweep settings, from the polar store when possible. The panel
+    # solution is inviscid and incompressible, so it is stored per geometry and alpha sweep only and the Mach
+    # correction is applied on the way out
+    x_coords, y_coords = airfoil_outline(obj)
+    settings = "vortex|%d|%.4f|%.4f|%d" % (scene.panel_count, scene.alpha_start, scene.alpha_end, scene.alpha_count)
+    key = PolarStore.key(outline_hash(x_coords, y_coords), settings)
+    polar = polar_store.get(key)
+    cached = polar is not None
+    if not cached:
+        alphas = np.linspace(scene.alpha_start, scene.alpha_end, scene.alpha_count)
+        cl, cm = VortexPanelSolver(*panel_contour(x_coords, y_coords, scene.panel_count)).polar(alphas)
+        try:
+            polar = polar_store.put(key, alphas, cl, cm)
+        except OSError:
+            polar = np.stack([alphas, cl, cm])
+    factor = compressibility_factor(scene.mach_number)
+    return polar[0], polar[1] * factor, polar[2] * factor, cached
+
+_polar_results = {}
+
+# International Standard Atmosphere layers: (base geopotential altitude m, lapse rate K/m)
+ISA_LAYERS = (
+    (0.0, -0.0065),
+    (11000.0, 0.0),
+    (20000.0, 0.001),
+    (32000.0, 0.0028),
+    (47000.0, 0.0),
+    (51000.0, -0.0028),
+    (71000.0, -0.002),
+    (84852.0, 0.0),
+)
+ISA_GAS_CONSTANT = 287.05287
+ISA_GRAVITY = 9.80665
+
+def sutherland_viscosity(temperature):
+    return 1.458e-6 * temperature**1.5 / (temperature + 110.4)
+
+class AtmosphereTable:
+    # Standard temperature and log-pressure tabulated once on a uniform altitude grid; a temperature offset
+    # shifts the temperature at the standard pressure, so density and viscosity stay one interpolation away
+    def __init__(self, ceiling=84000.0, step=10.0):
+        self.altitude = np.arange(-1000.0, ceiling + step, step)
+        bases = np.array([base for base, _ in ISA_LAYERS])
+        lapses = np.array([lapse for _, lapse in ISA_LAYERS])
+        base_temperature = np.empty(len(ISA_LAYERS))
+        base_pressure = np.empty(len(ISA_LAYERS))
+        base_temperature[0], base_pressure[0] = 288.15, 101325.0
+        for i in range(1, len(ISA_LAYERS)):
+            base_temperature[i], base_pressure[i] = self._layer(bases[i] - bases[i - 1], base_temperature[i - 1],
+                                                                base_pressure[i - 1], lapses[i - 1])
+        layer = np.clip(np.searchsorted(bases, self.altitude, side='right') - 1, 0, None)
+        self.temperature, pressure = self._layer(self.altitude - bases[layer], base_temperature[layer],
+                                                 base_pressure[layer], lapses[layer])
+        self.log_pressure = np.log(pressure)
+    
+    @staticmethod
+    def _layer(height, temperature, pressure, lapse):
+        height, temperature, pressure, lapse = np.broadcast_arrays(height, temperature, pressure, lapse)
+        top = temperature + lapse * height
+        with np.errstate(divide='ignore', invalid='ignore'):
+            gradient = pressure * (temperature / top) ** (ISA_GRAVITY / (ISA_GAS_CONSTANT * lapse))
+        isothermal = pressure * np.exp(-ISA_GRAVITY * height / (ISA_GAS_CONSTANT * temperature))
+        return top, np.where(lapse == 0.0, isothermal, gradient)
+    
+    def properties(self, altitude, temperature_offset=0.0):
+        # Returns (temperature K, pressure Pa, density kg/m^3, dynamic viscosity Pa.s) for scalar or array altitudes
+        altitude = np.asarray(altitude, dtype=np.float64)
+        temperature = np.interp(altitude, self.altitude, self.temperature) + temperature_offset
+        pressure = np.exp(np.interp(altitude, self.altitude, self.log_pressure))
+        density = pressure / (ISA_GAS_CONSTANT * temperature)
+        return temperature, pressure, density, sutherland_viscosity(temperature)
+
+_atmosphere_table = None
+
+def atmosphere_table():
+    global _atmosphere_table
+    if _atmosphere_table is None:
+        _atmosphere_table = AtmosphereTable()
+    return _atmosphere_table
+
+def atmosphere_density_viscosity(scene):
+    _, _, density, viscosity = atmosphere_table().properties(scene.altitude, scene.temperature_offset)
+    return float(density), float(viscosity)
+
+def object_planforms(objects, depsgraph):
+    # Reads every evaluated mesh in bulk and measures all of them together: span is the world Y extent,
+    # planform area the XY projection of the faces (world Z of each face's area vector), chord their ratio
+    low, high, projected, owners = [], [], [], []
+    for index, obj in enumerate(objects):
+        evaluated = obj.evaluated_get(depsgraph)
+        mesh = evaluated.to_mesh()
+        try:
+            co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+            mesh.vertices.foreach_get("co", co)
+            normals = np.empty(len(mesh.polygons) * 3, dtype=np.float32)
+            mesh.polygons.foreach_get("normal", normals)
+            areas = np.empty(len(mesh.polygons), dtype=np.float32)
+            mesh.polygons.foreach_get("area", areas)
+        finally:
+            evaluated.to_mesh_clear()
+        matrix = np.array(obj.matrix_world, dtype=np.float64)
+        co = co.reshape(-1, 3) @ matrix[:3, :3].T + matrix[:3, 3]
+        # Meshes that evaluate to no vertices (e.g. a fully masked modifier stack) measure zero
+        low.append(co.min(axis=0) if len(co) else np.zeros(3))
+        high.append(co.max(axis=0) if len(co) else np.zeros(3))
+        # Area vectors transform with the cofactor matrix, which also carries the object scale; its Z row is the
+        # cross product of the first two rows, defined for flattened (zero scale) objects too
+        cofactor_z = np.cross(matrix[0, :3], matrix[1, :3])
+        projected.append((normals.reshape(-1, 3) * areas[:, None]) @ cofactor_z)
+        owners.append(np.full(len(areas), index, dtype=np.int64))
+    
+    count = len(objects)
+    low, high = np.array(low), np.array(high)
+    projected = np.concatenate(projected)
+    owners = np.concatenate(owners)
+    # Closed surfaces project once facing up and once facing down; single-sided planforms only one way
+    up = np.bincount(owners, weights=np.clip(projected, 0, None), minlength=count)
+    down = np.bincount(owners, weights=np.clip(-projected, 0, None), minlength=count)
+    area = np.maximum(up, down)
+    span = high[:, 1] - low[:, 1]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        chord = np.where((area > 0) & (span > 0), area / span, high[:, 0] - low[:, 0])
+    return chord, span, area
+
+def animated_values(scene, name, frames):
+    # Samples the Scene property's F-curve at every frame, or repeats its current value when it isn't animated
+    action = scene.animation_data.action if scene.animation_data else None
+    fcurve = action.fcurves.find(name) if action else None
+    if fcurve is None:
+        return np.full(len(frames), getattr(scene, name), dtype=np.float64)
+    return np.fromiter(map(fcurve.evaluate, frames.tolist()), dtype=np.float64, count=len(frames))
+
+def write_fcurve(action, data_path, frames, values):
+    fcurve = action.fcurves.find(data_path)
+    if fcurve is not None:
+        action.fcurves.remove(fcurve)
+    fcurve = action.fcurves.new(data_path)
+    fcurve.keyframe_points.add(len(frames))
+    fcurve.keyframe_points.foreach_set("co", np.column_stack([frames, values]).astype(np.float32).ravel())
+    # One key per frame, so linear interpolation (enum index 1) reproduces the sampled values exactly
+    fcurve.keyframe_points.foreach_set("interpolation", np.ones(len(frames), dtype=np.int32))
+    fcurve.update()
+    return fcurve
+
+def bake_flight(scene, obj, frames):
+    # Returns (reynolds, lift) per frame from the animated inputs
+    sample = lambda name: animated_values(scene, name, frames)
+    density, viscosity, density_lift = sample("density"), sample("viscosity"), sample("density_lift")
+    if scene.use_atmosphere:
+        _, _, density, viscosity = atmosphere_table().properties(sample("altitude"), sample("temperature_offset"))
+        density_lift = density
+    with np.errstate(divide='ignore', invalid='ignore'):
+        reynolds = density * sample("velocity") * sample("characteristic_length") / viscosity
+    
+    if scene.use_panel_solver:
+        lift_coefficient = section_coefficients(scene, obj, sample("angle_of_attack"))[0]
+    else:
+        lift_coefficient = sample("lift_coefficient")
+    lift = 0.5 * density_lift * sample("velocity_lift")**2 * sample("wing_area") * lift_coefficient
+    return reynolds, lift
+
+# Rows in the full Cartesian product of a sweep, large enough for dense 2D/3D grids while staying well inside memory
+MAX_SWEEP_POINTS = 1000000
+
+def parse_sweep(text, default):
+    # "start:stop:count" for an evenly spaced range, otherwise a comma or space separated list; blank keeps the scalar
+    text = text.strip()
+    if not text:
+        return np.array([default], dtype=np.float64)
+    try:
+        if ":" in text:
+            start, stop, count = text.split(":")
+            start, stop, count = float(start), float(stop), int(count)
+            if count < 0:
+                raise ValueError
+        else:
+            values = np.array(text.replace(",", " ").split(), dtype=np.float64)
+            count = values.size
+    except ValueError:
+        raise ValueError("Invalid sweep '%s', use start:stop:count or a list of values" % text)
+    if count > MAX_SWEEP_POINTS:
+        raise ValueError("Sweep '%s' has %d values, the limit is %d" % (text, count, MAX_SWEEP_POINTS))
+    if ":" in text:
+        values = np.linspace(start, stop, count)
+    if values.size == 0:
+        raise ValueError("Sweep '%s' has no values" % text)
+    return values
+
+def check_sweep_size(axes):
+    size = 1
+    for values in axes.values():
+        size *= len(values)
+    if size > MAX_SWEEP_POINTS:
+        raise ValueError("Sweep has %d rows, the limit is %d" % (size, MAX_SWEEP_POINTS))
+
+# (column name, sweep property, scalar property)
+SWEEP_INPUTS = (
+    ("altitude", "sweep_altitude", "altitude"),
+    ("density", "sweep_density", "density"),
+    ("velocity", "sweep_velocity", "velocity"),
+    ("length", "sweep_length", "characteristic_length"),
+    ("viscosity", "sweep_viscosity", "viscosity"),
+    ("density_lift", "sweep_density_lift", "density_lift"),
+    ("velocity_lift", "sweep_velocity_lift", "velocity_lift"),
+    ("wing_area", "sweep_wing_area", "wing_area"),
+    ("lift_coefficient", "sweep_lift_coefficient", "lift_coefficient"),
+)
+
+class SweepResult:
+    # Inputs and outputs are kept in their broadcast shapes (one axis per input), the full Cartesian product is
+    # only materialised row by row for display or on export
+    def __init__(self, axes, temperature_offset=None):
+        self.axes = axes
+        self.shape = tuple(len(values) for values in axes.values())
+        fields = dict(zip(axes, np.ix_(*axes.values())))
+        if temperature_offset is not None:
+            # Both densities and the viscosity follow the altitude axis instead of their own
+            _, _, density, viscosity = atmosphere_table().properties(fields["altitude"], temperature_offset)
+            for name, value in (("density", density), ("density_lift", density), ("viscosity", viscosity)):
+                fields[name] = np.broadcast_to(value, np.broadcast_shapes(value.shape, fields[name].shape))
+        fields["reynolds"] = fields["density"] * fields["velocity"] * fields["length"] / fields["viscosity"]
+        fields["lift"] = (0.5 * fields["density_lift"] * fields["velocity_lift"]**2 * fields["wing_area"]
+                          * fields["lift_coefficient"])
+        self.fields = fields
+    
+    @property
+    def reynolds(self):
+        return self.fields["reynolds"]
+    
+    @property
+    def lift(self):
+        return self.fields["lift"]
+    
+    @property
+    def size(self):
+        return int(np.prod(self.shape))
+    
+    @property
+    def columns(self):
+        return tuple(self.axes) + ("reynolds", "lift")
+    
+    def rows(self, start=0, stop=None):
+        flat = np.arange(start, min(self.size, self.size if stop is None else stop))
+        index = np.unravel_index(flat, self.shape)
+        return np.column_stack([np.broadcast_to(self.fields[name], self.shape)[index] for name in self.columns])
+    
+    def save_csv(self, path):
+        np.savetxt(path, self.rows(), fmt="%.8g", delimiter=",", header=",".join(self.columns), comments="")
+    
+    def save_npy(self, path):
+        np.save(path, self.rows())
+
+_sweep_results = {}
+
+def calculate_reynolds(scene):
+    density = scene.density
+    velocity = scene.velocity
+    characteristic_length = scene.characteristic_length
+    viscosity = scene.viscosity
+    if scene.use_atmosphere:
+        density, viscosity = atmosphere_density_viscosity(scene)
+    
+    # Calculate Reynolds Number
+    scene.reynolds_number = (density * velocity * characteristic_length) / viscosity
+
+def section_coefficients(scene, obj, angles):
+    # (cl, cm) at each angle of attack: interpolated on the stored polar inside its range, whichever way the sweep
+    # runs, and solved directly for the distinct angles outside it instead of clamping to the end values
+    alphas, cl, cm, cached = airfoil_polar(scene, obj)
+    angles = np.atleast_1d(np.asarray(angles, dtype=np.float64))
+    if alphas[0] > alphas[-1]:
+        alphas, cl, cm = alphas[::-1], cl[::-1], cm[::-1]
+    outside = (angles < alphas[0]) | (angles > alphas[-1]) | (len(alphas) < 2)
+    result_cl = np.interp(angles, alphas, cl)
+    result_cm = np.interp(angles, alphas, cm)
+    if outside.any():
+        solve, index = np.unique(angles[outside], return_inverse=True)
+        x_coords, y_coords = airfoil_outline(obj)
+        solved_cl, solved_cm = VortexPanelSolver(*panel_contour(x_coords, y_coords, scene.panel_count)).polar(solve)
+        factor = compressibility_factor(scene.mach_number)
+        result_cl[outside] = solved_cl[index] * factor
+        result_cm[outside] = solved_cm[index] * factor
+    return result_cl, result_cm
+
+def calculate_section_coefficients(scene, obj):
+    if not scene.use_panel_solver:
+        return
+    cl, cm = section_coefficients(scene, obj, scene.angle_of_attack)
+    scene.lift_coefficient = float(cl[0])
+    scene.moment_coefficient = float(cm[0])
+
+def calculate_lift_force(scene):
+    density = scene.density_lift
+    if scene.use_atmosphere:
+        density = atmosphere_density_viscosity(scene)[0]
+    velocity = scene.velocity_lift
+    wing_area = scene.wing_area
+    lift_coefficient = scene.lift_coefficient
+    
+    # Calculate Lift Force
+    scene.lift_force = 0.5 * density * (velocity ** 2) * wing_area * lift_coefficient
+
+def scene_airfoil(scene, context):
+    # The airfoil bound in the panel, otherwise the active object
+    return scene.airfoil_object or context.active_object
+
+def _live_section_coefficients(scene):
+    # Live updates only follow the bound airfoil, never whichever object happens to be active
+    if scene.airfoil_object is not None:
+        calculate_section_coefficients(scene, scene.airfoil_object)
+
+# Live outputs in dependency order: name -> (Scene inputs it reads, function recomputing it)
+LIVE_OUTPUTS = {
+    "reynolds_number": (
+        ("density", "velocity", "characteristic_length", "viscosity", "use_atmosphere", "altitude", "temperature_offset"),
+        calculate_reynolds),
+    "lift_coefficient": (
+        ("use_panel_solver", "airfoil_object", "angle_of_attack", "mach_number", "panel_count", "alpha_start", "alpha_end",
+         "alpha_count"),
+        _live_section_coefficients),
+    "lift_force": (
+        ("density_lift", "velocity_lift", "wing_area", "lift_coefficient", "use_atmosphere", "altitude", "temperature_offset"),
+        calculate_lift_force),
+}
+
+def _live_dependents():
+    # Every output reachable from each input, following outputs that feed other outputs
+    direct = {}
+    for output, (inputs, _) in LIVE_OUTPUTS.items():
+        for name in inputs:
+            direct.setdefault(name, set()).add(output)
+    dependents = {}
+    for name in direct:
+        reached, stack = set(), [name]
+        while stack:
+            for output in direct.get(stack.pop(), ()):
+                if output not in reached:
+                    reached.add(output)
+                    stack.append(output)
+        dependents[name] = reached
+    return dependents
+
+LIVE_DEPENDENTS = _live_dependents()
+LIVE_UPDATE_DELAY = 0.1
+
+_live_dirty = {}
+_live_state = {"suspended": 0, "last_change": 0.0}
+
+@contextlib.contextmanager
+def suspend_live_updates():
+    _live_state["suspended"] += 1
+    try:
+        yield
+    finally:
+        _live_state["suspended"] -= 1
+
+def _flush_live_updates():
+    # Debounce: while inputs keep changing (slider drags) the timer is pushed back instead of recomputing
+    waited = time.monotonic() - _live_state["last_change"]
+    if waited < LIVE_UPDATE_DELAY:
+        return LIVE_UPDATE_DELAY - waited
+    dirty = dict(_live_dirty)
+    _live_dirty.clear()
+    with suspend_live_updates():
+        for scene_name, outputs in dirty.items():
+            scene = bpy.data.scenes.get(scene_name)
+            if scene is None or not scene.live_update:
+                continue
+            for output, (_, function) in LIVE_OUTPUTS.items():
+                if output in outputs:
+                    try:
+                        function(scene)
+                    except (ValueError, ZeroDivisionError, np.linalg.LinAlgError):
+                        pass
+    for window in bpy.context.window_manager.windows:
+        for area in window.screen.areas:
+            if area.type == 'VIEW_3D':
+                area.tag_redraw()
+    return None
+
+def mark_live_outputs(scene, outputs):
+    if not outputs or _live_state["suspended"] or not scene.live_update:
+        return
+    _live_dirty.setdefault(scene.name, set()).update(outputs)
+    _live_state["last_change"] = time.monotonic()
+    if not bpy.app.timers.is_registered(_flush_live_updates):
+        bpy.app.timers.register(_flush_live_updates, first_interval=LIVE_UPDATE_DELAY)
+
+def live_update(name):
+    outputs = LIVE_DEPENDENTS.get(name, set())
+    def update(self, context):
+        mark_live_outputs(self, outputs)
+    return update
+
+def _live_update_toggled(self, context):
+    mark_live_outputs(self, set(LIVE_OUTPUTS))
+
+class SweepCalculatorPanel(bpy.types.Panel):
+    bl_label = "Design Sweep"
+    bl_idname = "OBJECT_PT_design_sweep"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = 'Reynolds & Lift'
+    bl_options = {'DEFAULT_CLOSED'}
+    
+    def draw(self, context):
+        layout = self.layout
+        scene = context.scene
+        
+        layout.label(text="start:stop:count or list, blank = panel value")
+        for name, sweep_prop, _ in SWEEP_INPUTS:
+            if scene.use_atmosphere:
+                if name in ("density", "viscosity", "density_lift"):
+                    continue
+            elif name == "altitude":
+                continue
+            layout.prop(scene, sweep_prop)
+        layout.operator("object.calculate_sweep", text="Calculate Sweep")
+        
+        result = _sweep_results.get(scene.name)
+        if result is None:
+            return
+        layout.label(text="%d points" % result.size)
+        layout.label(text="Reynolds: %.4g to %.4g" % (result.reynolds.min(), result.reynolds.max()))
+        layout.label(text="Lift: %.4g to %.4g N" % (result.lift.min(), result.lift.max()))
+        
+        box = layout.box()
+        grid = box.grid_flow(row_major=True, columns=len(result.columns), align=True)
+        for name in ("h", "rho", "V", "L", "mu", "rho_L", "V_L", "S", "C_L", "Re", "Lift"):
+            grid.label(text=name)
+        for row in result.rows(0, scene.sweep_table_rows):
+            for value in row:
+                grid.label(text="%.4g" % value)
+        layout.prop(scene, "sweep_table_rows")
+        layout.operator("object.export_sweep", text="Export Sweep")
 
 class ReynoldsCalculatorPanel(bpy.types.Panel):
     bl_label = "Reynolds Calculator"
@@ -24,10 +677,19 @@ class ReynoldsCalculatorPanel(bpy.types.Panel):
         scene = context.scene
         
         layout.label(text="Reynolds Number Calculation")
-        layout.prop(scene, "density")
+        layout.prop(scene, "live_update")
+        layout.prop(scene, "use_atmosphere")
+        if scene.use_atmosphere:
+            layout.prop(scene, "altitude")
+            layout.prop(scene, "temperature_offset")
+            density, viscosity = atmosphere_density_viscosity(scene)
+            layout.label(text="Density: %.4f kg/m^3, Viscosity: %.4g Pa.s" % (density, viscosity))
+        else:
+            layout.prop(scene, "density")
         layout.prop(scene, "velocity")
         layout.prop(scene, "characteristic_length")
-        layout.prop(scene, "viscosity")
+        if not scene.use_atmosphere:
+            layout.prop(scene, "viscosity")
         layout.operator("object.calculate_reynolds", text="Calculate Reynolds Number")
         layout.label(text="Reynolds Number: " + str(scene.reynolds_number))
 
@@ -43,27 +705,48 @@ class LiftCalculatorPanel(bpy.types.Panel):
         scene = context.scene
         
         layout.label(text="Lift Force Calculation")
-        layout.prop(scene, "density_lift")
+        if scene.use_atmosphere:
+            layout.label(text="Density: %.4f kg/m^3 (ISA %.0f m)" % (atmosphere_density_viscosity(scene)[0], scene.altitude))
+        else:
+            layout.prop(scene, "density_lift")
         layout.prop(scene, "velocity_lift")
         layout.prop(scene, "wing_area")
-        layout.prop(scene, "lift_coefficient")
+        layout.prop(scene, "use_panel_solver")
+        if scene.use_panel_solver:
+            layout.prop(scene, "airfoil_object")
+            layout.prop(scene, "angle_of_attack")
+            layout.prop(scene, "mach_number")
+            layout.prop(scene, "panel_count")
+            layout.label(text="Lift Coefficient (C_L): %.4f" % scene.lift_coefficient)
+            layout.label(text="Moment Coefficient (C_m c/4): %.4f" % scene.moment_coefficient)
+        else:
+            layout.prop(scene, "lift_coefficient")
         layout.operator("object.calculate_lift", text="Calculate Lift Force")
         layout.label(text="Lift Force: " + str(scene.lift_force) + " N")
+        layout.operator("object.calculate_selected_aero", text="Calculate Selected Objects")
+        layout.operator("object.bake_reynolds_lift", text="Bake Reynolds and Lift")
+        
+        layout.separator()
+        layout.label(text="Polar Sweep")
+        row = layout.row(align=True)
+        row.prop(scene, "alpha_start", text="From")
+        row.prop(scene, "alpha_end", text="To")
+        row.prop(scene, "alpha_count", text="Steps")
+        layout.operator("object.calculate_polar", text="Calculate Polar")
+        polar = _polar_results.get(scene.name)
+        if polar is not None:
+            slope = np.polyfit(np.radians(polar["alpha"]), polar["cl"], 1)[0] if len(polar["alpha"]) > 1 else 0.0
+            layout.label(text="%s: C_L %.3f to %.3f, dC_L/da %.2f /rad%s" % (
+                polar["object"], polar["cl"].min(), polar["cl"].max(), slope, " (cached)" if polar["cached"] else ""))
+        layout.operator("object.clear_polar_cache", text="Clear Polar Cache")
 
 class CalculateReynoldsOperator(bpy.types.Operator):
     bl_label = "Calculate Reynolds"
     bl_idname = "object.calculate_reynolds"
 
     def execute(self, context):
-        scene = context.scene
-        density = scene.density
-        velocity = scene.velocity
-        characteristic_length = scene.characteristic_length
-        viscosity = scene.viscosity
-        
-        # Calculate Reynolds Number
-        reynolds_number = (density * velocity * characteristic_length) / viscosity
-        scene.reynolds_number = reynolds_number
+        with suspend_live_updates():
+            calculate_reynolds(context.scene)
         
         return {'FINISHED'}
 
@@ -73,49 +756,190 @@ class CalculateLiftOperator(bpy.types.Operator):
 
     def execute(self, context):
         scene = context.scene
-        density = scene.density_lift
-        velocity = scene.velocity_lift
-        wing_area = scene.wing_area
-        lift_coefficient = scene.lift_coefficient
+        if scene.use_panel_solver:
+            try:
+                with suspend_live_updates():
+                    calculate_section_coefficients(scene, scene_airfoil(scene, context))
+            except (ValueError, np.linalg.LinAlgError) as e:
+                self.report({'ERROR'}, str(e))
+                return {'CANCELLED'}
         
-        # Calculate Lift Force
-        lift_force = 0.5 * density * (velocity ** 2) * wing_area * lift_coefficient
-        scene.lift_force = lift_force
+        with suspend_live_updates():
+            calculate_lift_force(scene)
         
         return {'FINISHED'}
 
+class CalculateSelectedObjectsOperator(bpy.types.Operator):
+    bl_label = "Calculate Selected Objects"
+    bl_idname = "object.calculate_selected_aero"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        scene = context.scene
+        objects = [obj for obj in context.selected_objects if obj.type == 'MESH' and len(obj.data.vertices)]
+        if not objects:
+            self.report({'ERROR'}, "Select one or more mesh objects")
+            return {'CANCELLED'}
+        
+        chord, span, area = object_planforms(objects, context.evaluated_depsgraph_get())
+        density, viscosity, density_lift = scene.density, scene.viscosity, scene.density_lift
+        if scene.use_atmosphere:
+            density, viscosity = atmosphere_density_viscosity(scene)
+            density_lift = density
+        with np.errstate(divide='ignore', invalid='ignore'):
+            reynolds = density * scene.velocity * chord / viscosity
+        lift = 0.5 * density_lift * scene.velocity_lift**2 * area * scene.lift_coefficient
+        
+        for obj, values in zip(objects, np.column_stack([chord, span, area, reynolds, lift]).tolist()):
+            obj["chord"], obj["span"], obj["planform_area"], obj["reynolds_number"], obj["lift_force"] = values
+        self.report({'INFO'}, "Calculated %d objects" % len(objects))
+        return {'FINISHED'}
+
+class BakeFlightOperator(bpy.types.Operator):
+    bl_label = "Bake Reynolds and Lift"
+    bl_idname = "object.bake_reynolds_lift"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        scene = context.scene
+        frames = np.arange(scene.frame_start, scene.frame_end + 1, dtype=np.float64)
+        try:
+            reynolds, lift = bake_flight(scene, scene_airfoil(scene, context), frames)
+        except (ValueError, np.linalg.LinAlgError) as e:
+            self.report({'ERROR'}, str(e))
+            return {'CANCELLED'}
+        
+        if scene.animation_data is None:
+            scene.animation_data_create()
+        if scene.animation_data.action is None:
+            scene.animation_data.action = bpy.data.actions.new(scene.name + "Action")
+        action = scene.animation_data.action
+        write_fcurve(action, "reynolds_number", frames, reynolds)
+        write_fcurve(action, "lift_force", frames, lift)
+        self.report({'INFO'}, "Baked %d frames" % len(frames))
+        return {'FINISHED'}
+
+class CalculatePolarOperator(bpy.types.Operator):
+    bl_label = "Calculate Polar"
+    bl_idname = "object.calculate_polar"
+
+    def execute(self, context):
+        scene = context.scene
+        obj = scene_airfoil(scene, context)
+        try:
+            alphas, cl, cm, cached = airfoil_polar(scene, obj)
+            # Feed the lift calculator with the coefficient at the current angle of attack
+            lift_coefficient, moment_coefficient = section_coefficients(scene, obj, scene.angle_of_attack)
+        except (ValueError, np.linalg.LinAlgError) as e:
+            self.report({'ERROR'}, str(e))
+            return {'CANCELLED'}
+        _polar_results[scene.name] = {"object": obj.name, "alpha": np.array(alphas),
+                                      "cl": np.array(cl), "cm": np.array(cm), "cached": cached}
+        scene.lift_coefficient = float(lift_coefficient[0])
+        scene.moment_coefficient = float(moment_coefficient[0])
+        return {'FINISHED'}
+
+class ClearPolarCacheOperator(bpy.types.Operator):
+    bl_label = "Clear Polar Cache"
+    bl_idname = "object.clear_polar_cache"
+
+    def execute(self, context):
+        polar_store.clear()
+        _polar_results.clear()
+        return {'FINISHED'}
+
+class CalculateSweepOperator(bpy.types.Operator):
+    bl_label = "Calculate Sweep"
+    bl_idname = "object.calculate_sweep"
+
+    def execute(self, context):
+        scene = context.scene
+        axes = {}
+        try:
+            for name, sweep_prop, scalar_prop in SWEEP_INPUTS:
+                axes[name] = parse_sweep(getattr(scene, sweep_prop), getattr(scene, scalar_prop))
+            temperature_offset = None
+            if scene.use_atmosphere:
+                temperature_offset = scene.temperature_offset
+                axes["density"] = axes["density"][:1]
+                axes["viscosity"] = axes["viscosity"][:1]
+                axes["density_lift"] = axes["density_lift"][:1]
+            else:
+                axes["altitude"] = axes["altitude"][:1]
+            check_sweep_size(axes)
+        except ValueError as e:
+            self.report({'ERROR'}, str(e))
+            return {'CANCELLED'}
+        with np.errstate(divide='ignore', invalid='ignore'):
+            _sweep_results[scene.name] = SweepResult(axes, temperature_offset)
+        return {'FINISHED'}
+
+class ExportSweepOperator(bpy.types.Operator):
+    bl_label = "Export Sweep"
+    bl_idname = "object.export_sweep"
+
+    filepath: bpy.props.StringProperty(subtype='FILE_PATH', default="sweep.csv")
+
+    def invoke(self, context, event):
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+    def execute(self, context):
+        result = _sweep_results.get(context.scene.name)
+        if result is None:
+            self.report({'ERROR'}, "Calculate a sweep first")
+            return {'CANCELLED'}
+        path = bpy.path.abspath(self.filepath)
+        if path.lower().endswith(".npy"):
+            result.save_npy(path)
+        else:
+            result.save_csv(path)
+        self.report({'INFO'}, "Exported %d rows to %s" % (result.size, path))
+        return {'FINISHED'}
+
 def register():
     bpy.utils.register_class(ReynoldsCalculatorPanel)
     bpy.utils.register_class(LiftCalculatorPanel)
+    bpy.utils.register_class(SweepCalculatorPanel)
     bpy.utils.register_class(CalculateReynoldsOperator)
     bpy.utils.register_class(CalculateLiftOperator)
+    bpy.utils.register_class(CalculateSelectedObjectsOperator)
+    bpy.utils.register_class(BakeFlightOperator)
+    bpy.utils.register_class(CalculatePolarOperator)
+    bpy.utils.register_class(ClearPolarCacheOperator)
+    bpy.utils.register_class(CalculateSweepOperator)
+    bpy.utils.register_class(ExportSweepOperator)
     
     bpy.types.Scene.density = bpy.props.FloatProperty(
         name="Density (kg/m^3)",
         description="Density of the fluid for Reynolds calculation",
         default=1.225,
-        min=0.0
+        min=0.0,
+        update=live_update("density")
     )
     
     bpy.types.Scene.velocity = bpy.props.FloatProperty(
         name="Velocity (m/s)",
         description="Velocity of the fluid for Reynolds calculation",
         default=10.0,
-        min=0.0
+        min=0.0,
+        update=live_update("velocity")
     )
     
     bpy.types.Scene.characteristic_length = bpy.props.FloatProperty(
         name="Characteristic Length (m)",
         description="Characteristic length of the object for Reynolds calculation",
         default=1.0,
-        min=0.0
+        min=0.0,
+        update=live_update("characteristic_length")
     )
     
     bpy.types.Scene.viscosity = bpy.props.FloatProperty(
         name="Viscosity (Pa.s)",
         description="Dynamic viscosity of the fluid for Reynolds calculation",
         default=0.0000181,
-        min=0.0
+        min=0.0,
+        update=live_update("viscosity")
     )
     
     bpy.types.Scene.reynolds_number = bpy.props.FloatProperty(
@@ -128,30 +952,127 @@ def register():
         name="Density (kg/m^3)",
         description="Density of the fluid for lift calculation",
         default=1.225,
-        min=0.0
+        min=0.0,
+        update=live_update("density_lift")
     )
     
     bpy.types.Scene.velocity_lift = bpy.props.FloatProperty(
         name="Velocity (m/s)",
         description="Velocity of the fluid for lift calculation",
         default=10.0,
-        min=0.0
+        min=0.0,
+        update=live_update("velocity_lift")
     )
     
     bpy.types.Scene.wing_area = bpy.props.FloatProperty(
         name="Wing Area (m²)",
         description="Wing area of the airplane",
         default=20.0,
-        min=0.0
+        min=0.0,
+        update=live_update("wing_area")
     )
     
     bpy.types.Scene.lift_coefficient = bpy.props.FloatProperty(
         name="Lift Coefficient (C_L)",
         description="Lift coefficient",
         default=1.5,
-        min=0.0
+        update=live_update("lift_coefficient")
     )
     
+    bpy.types.Scene.use_panel_solver = bpy.props.BoolProperty(
+        name="C_L from Airfoil",
+        description="Compute the lift coefficient of an airfoil outline with a vortex panel solver",
+        default=False,
+        update=live_update("use_panel_solver")
+    )
+    
+    bpy.types.Scene.airfoil_object = bpy.props.PointerProperty(
+        name="Airfoil",
+        description="Airfoil outline mesh for the panel solver; live updates only use this object, "
+                    "the operators fall back to the active object when it is empty",
+        type=bpy.types.Object,
+        poll=lambda self, obj: obj.type == 'MESH',
+        update=live_update("airfoil_object")
+    )
+    
+    bpy.types.Scene.angle_of_attack = bpy.props.FloatProperty(
+        name="Angle of Attack (deg)",
+        description="Angle of attack for the panel solver",
+        default=5.0,
+        min=-30.0,
+        max=30.0,
+        update=live_update("angle_of_attack")
+    )
+    
+    bpy.types.Scene.panel_count = bpy.props.IntProperty(
+        name="Panels",
+        description="Number of panels the airfoil outline is resampled to",
+        default=160,
+        min=20,
+        max=1000,
+        update=live_update("panel_count")
+    )
+    
+    bpy.types.Scene.moment_coefficient = bpy.props.FloatProperty(
+        name="Moment Coefficient (C_m)",
+        description="Calculated pitching moment coefficient about the quarter chord",
+        default=0.0
+    )
+    
+    bpy.types.Scene.live_update = bpy.props.BoolProperty(
+        name="Live Update",
+        description="Recompute the Reynolds number, lift coefficient and lift force whenever an input changes",
+        default=True,
+        update=_live_update_toggled
+    )
+    
+    bpy.types.Scene.use_atmosphere = bpy.props.BoolProperty(
+        name="Standard Atmosphere",
+        description="Take density and viscosity from the International Standard Atmosphere at the given altitude",
+        default=False,
+        update=live_update("use_atmosphere")
+    )
+    
+    bpy.types.Scene.altitude = bpy.props.FloatProperty(
+        name="Altitude (m)",
+        description="Geopotential altitude for the standard atmosphere",
+        default=0.0,
+        min=-1000.0,
+        max=84000.0,
+        update=live_update("altitude")
+    )
+    
+    bpy.types.Scene.temperature_offset = bpy.props.FloatProperty(
+        name="Temperature Offset (K)",
+        description="Offset from the standard temperature (ISA + dT)",
+        default=0.0,
+        min=-100.0,
+        max=100.0,
+        update=live_update("temperature_offset")
+    )
+    
+    for name, sweep_prop, _ in SWEEP_INPUTS:
+        setattr(bpy.types.Scene, sweep_prop, bpy.props.StringProperty(
+            name=name.replace("_", " ").title(),
+            description="Sweep values for %s: start:stop:count or a list" % name.replace("_", " "),
+            default=""
+        ))
+    
+    bpy.types.Scene.sweep_table_rows = bpy.props.IntProperty(name="Table Rows", default=10, min=1, max=100)
+    
+    bpy.types.Scene.mach_number = bpy.props.FloatProperty(
+        name="Mach Number",
+        description="Free-stream Mach number for the Prandtl-Glauert correction",
+        default=0.0,
+        min=0.0,
+        max=0.7,
+        update=live_update("mach_number")
+    )
+    
+    bpy.types.Scene.alpha_start = bpy.props.FloatProperty(name="Alpha Start (deg)", default=-5.0, min=-30.0, max=30.0, update=live_update("alpha_start"))
+    bpy.types.Scene.alpha_end = bpy.props.FloatProperty(name="Alpha End (deg)", default=15.0, min=-30.0, max=30.0, update=live_update("alpha_end"))
+    bpy.types.Scene.alpha_count = bpy.props.IntProperty(name="Alpha Steps", default=50, min=1, max=10000, update=live_update("alpha_count"))
+    
     bpy.types.Scene.lift_force = bpy.props.FloatProperty(
         name="Lift Force (N)",
         description="Calculated Lift Force",
@@ -159,10 +1080,20 @@ def register():
     )
 
 def unregister():
+    if bpy.app.timers.is_registered(_flush_live_updates):
+        bpy.app.timers.unregister(_flush_live_updates)
+    _live_dirty.clear()
     bpy.utils.unregister_class(ReynoldsCalculatorPanel)
     bpy.utils.unregister_class(LiftCalculatorPanel)
+    bpy.utils.unregister_class(SweepCalculatorPanel)
     bpy.utils.unregister_class(CalculateReynoldsOperator)
     bpy.utils.unregister_class(CalculateLiftOperator)
+    bpy.utils.unregister_class(CalculateSelectedObjectsOperator)
+    bpy.utils.unregister_class(BakeFlightOperator)
+    bpy.utils.unregister_class(CalculatePolarOperator)
+    bpy.utils.unregister_class(ClearPolarCacheOperator)
+    bpy.utils.unregister_class(CalculateSweepOperator)
+    bpy.utils.unregister_class(ExportSweepOperator)
     
     del bpy.types.Scene.density
     del bpy.types.Scene.velocity
@@ -173,6 +1104,22 @@ def unregister():
     del bpy.types.Scene.velocity_lift
     del bpy.types.Scene.wing_area
     del bpy.types.Scene.lift_coefficient
+    del bpy.types.Scene.use_panel_solver
+    del bpy.types.Scene.airfoil_object
+    del bpy.types.Scene.angle_of_attack
+    del bpy.types.Scene.panel_count
+    del bpy.types.Scene.moment_coefficient
+    del bpy.types.Scene.mach_number
+    del bpy.types.Scene.live_update
+    del bpy.types.Scene.use_atmosphere
+    del bpy.types.Scene.altitude
+    del bpy.types.Scene.temperature_offset
+    for _, sweep_prop, _ in SWEEP_INPUTS:
+        delattr(bpy.types.Scene, sweep_prop)
+    del bpy.types.Scene.sweep_table_rows
+    del bpy.types.Scene.alpha_start
+    del bpy.types.Scene.alpha_end
+    del bpy.types.Scene.alpha_count
     del bpy.types.Scene.lift_force
 
 if __name__ == "__main__":
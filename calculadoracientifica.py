@@ -1,5 +1,12 @@
 import bpy
+import ast
+import collections
 import math
+import multiprocessing
+import os
+import re
+import types
+import numpy as np
 
 # Definimos las constantes matemáticas, físicas y de otros campos de estudio
 constants = {
@@ -25,6 +32,611 @@ constants = {
     },
 }
 
+# Motor de expresiones: se analiza con ast contra una lista blanca, se pliegan las constantes
+# y el código compilado se guarda en una caché LRU
+class CalculatorError(ValueError):
+    pass
+
+SAFE_BUILTINS = {
+    'abs': abs,
+    'float': float,
+    'int': int,
+    'round': round,
+    'min': min,
+    'max': max,
+}
+
+ALLOWED_NODES = (
+    ast.Expression, ast.BinOp, ast.UnaryOp, ast.Compare, ast.BoolOp, ast.IfExp, ast.Call, ast.Name,
+    ast.Attribute, ast.Constant, ast.Tuple, ast.Load,
+    ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow, ast.UAdd, ast.USub, ast.Not,
+    ast.Eq, ast.NotEq, ast.Lt, ast.LtE, ast.Gt, ast.GtE, ast.And, ast.Or,
+)
+
+# Presupuesto de recursos: los operadores que pueden crecer sin límite pasan por comprobaciones previas
+MAX_EXPRESSION_LENGTH = 2000
+MAX_EXPRESSION_NODES = 500
+MAX_INTEGER_BITS = 10000
+MAX_SEQUENCE_LENGTH = 100000
+
+def _check_bits(bits):
+    if bits > MAX_INTEGER_BITS:
+        raise CalculatorError("Result too large (about %d bits)" % bits)
+
+def _is_integer(value):
+    return isinstance(value, int) and not isinstance(value, bool)
+
+def _guarded_pow(base, exponent):
+    if _is_integer(base) and _is_integer(exponent) and exponent > 0 and abs(base) > 1:
+        _check_bits(int((abs(base).bit_length() - 1) * exponent) + 1)
+    return base ** exponent
+
+def _guarded_mul(left, right):
+    if _is_integer(left) and _is_integer(right):
+        _check_bits(left.bit_length() + right.bit_length())
+    elif isinstance(left, tuple) or isinstance(right, tuple):
+        # Tuples only exist as prod() arguments; repeating them would nest without bound
+        raise CalculatorError("Tuples can't be repeated")
+    elif isinstance(left, str) and _is_integer(right) or isinstance(right, str) and _is_integer(left):
+        sequence, count = (left, right) if isinstance(left, str) else (right, left)
+        if len(sequence) * count > MAX_SEQUENCE_LENGTH:
+            raise CalculatorError("Result too long")
+    return left * right
+
+def _log2_factorial(n):
+    return math.lgamma(n + 1) / math.log(2) if n > 0 else 0.0
+
+def _guarded_factorial(n):
+    if _is_integer(n) and n > 0:
+        _check_bits(int(_log2_factorial(n)))
+    return math.factorial(n)
+
+def _guarded_comb(n, k):
+    if _is_integer(n) and _is_integer(k) and 0 <= k <= n:
+        _check_bits(int(_log2_factorial(n) - _log2_factorial(k) - _log2_factorial(n - k)))
+    return math.comb(n, k)
+
+def _guarded_perm(n, k=None):
+    if _is_integer(n) and n > 0 and (k is None or _is_integer(k) and 0 <= k <= n):
+        _check_bits(int(_log2_factorial(n) - _log2_factorial(n - (n if k is None else k))))
+    return math.perm(n, k)
+
+def _guarded_prod(iterable, start=1):
+    result = start
+    for value in iterable:
+        result = _guarded_mul(result, value)
+    return result
+
+def _guarded_lcm(*integers):
+    result = 1
+    for value in integers:
+        if _is_integer(result) and _is_integer(value) and value:
+            factor = abs(result) // math.gcd(result, value)
+            if factor > 1:
+                _check_bits(factor.bit_length() + abs(value).bit_length())
+        result = math.lcm(result, value)
+    return result
+
+BUDGET_GUARDS = {
+    '_guarded_pow': _guarded_pow,
+    '_guarded_mul': _guarded_mul,
+    '_guarded_factorial': _guarded_factorial,
+    '_guarded_comb': _guarded_comb,
+    '_guarded_perm': _guarded_perm,
+    '_guarded_prod': _guarded_prod,
+    '_guarded_lcm': _guarded_lcm,
+}
+
+class _BudgetTransformer(ast.NodeTransformer):
+    # Routes ** and * and the math functions whose integer results can grow through the guards above
+    OPERATORS = {ast.Pow: '_guarded_pow', ast.Mult: '_guarded_mul'}
+    FUNCTIONS = {'factorial': '_guarded_factorial', 'comb': '_guarded_comb', 'perm': '_guarded_perm',
+                 'prod': '_guarded_prod', 'lcm': '_guarded_lcm'}
+    
+    def __init__(self, variables=()):
+        self.variables = variables
+    
+    def visit_BinOp(self, node):
+        self.generic_visit(node)
+        guard = self.OPERATORS.get(type(node.op))
+        if guard is None:
+            return node
+        return ast.copy_location(ast.Call(ast.Name(guard, ast.Load()), [node.left, node.right], []), node)
+    
+    def visit_Attribute(self, node):
+        guard = self.FUNCTIONS.get(node.attr)
+        if guard is None:
+            return node
+        return ast.copy_location(ast.Name(guard, ast.Load()), node)
+    
+    def visit_Name(self, node):
+        guard = self.FUNCTIONS.get(node.id)
+        if guard is None or node.id in self.variables:
+            return node
+        return ast.copy_location(ast.Name(guard, ast.Load()), node)
+
+def calculator_namespace():
+    # math functions are also available without the math. prefix (sin(x), sqrt(2))
+    namespace = {name: getattr(math, name) for name in dir(math) if not name.startswith("_")}
+    namespace.update({"math": math, **SAFE_BUILTINS, **BUDGET_GUARDS})
+    for category in constants.values():
+        namespace.update(category)
+    return namespace
+
+class _ConstantFolder(ast.NodeTransformer):
+    # Replaces constant names, math attributes and pure sub-expressions of constants with their values
+    def __init__(self, namespace, variables):
+        self.namespace = namespace
+        self.variables = variables
+    
+    def _fold(self, node, operands):
+        if all(isinstance(operand, ast.Constant) for operand in operands):
+            try:
+                value = eval(compile(ast.Expression(node), "<fold>", "eval"), {"__builtins__": {}}, self.namespace)
+            except Exception:
+                # Leave it for evaluation time, which reports the error
+                return node
+            if isinstance(value, (int, float, complex, bool)):
+                return ast.copy_location(ast.Constant(value), node)
+        return node
+    
+    def visit_Name(self, node):
+        value = self.namespace.get(node.id)
+        if node.id not in self.variables and isinstance(value, (int, float)):
+            return ast.copy_location(ast.Constant(value), node)
+        return node
+    
+    def visit_Attribute(self, node):
+        value = getattr(math, node.attr, None)
+        if isinstance(value, float):
+            return ast.copy_location(ast.Constant(value), node)
+        return node
+    
+    def visit_BinOp(self, node):
+        self.generic_visit(node)
+        return self._fold(node, (node.left, node.right))
+    
+    def visit_UnaryOp(self, node):
+        self.generic_visit(node)
+        return self._fold(node, (node.operand,))
+    
+    def visit_Call(self, node):
+        self.generic_visit(node)
+        if node.keywords or isinstance(node.func, ast.Name) and node.func.id in self.variables:
+            return node
+        return self._fold(node, node.args)
+
+class ExpressionEngine:
+    def __init__(self, namespace, maxsize=256):
+        self.namespace = namespace
+        self._globals = {"__builtins__": {}, **namespace}
+        self._array_globals = None
+        self.maxsize = maxsize
+        self._cache = collections.OrderedDict()
+    
+    @staticmethod
+    def normalize(expression):
+        return " ".join(expression.split())
+    
+    def _validate(self, tree, variables):
+        nodes = list(ast.walk(tree))
+        if len(nodes) > MAX_EXPRESSION_NODES:
+            raise CalculatorError("Expression too complex")
+        for node in nodes:
+            if not isinstance(node, ALLOWED_NODES):
+                raise CalculatorError("'%s' is not allowed" % type(node).__name__)
+            if isinstance(node, ast.Name) and (node.id.startswith("_") or node.id not in self.namespace
+                                               and node.id not in variables):
+                raise CalculatorError("Unknown name '%s'" % node.id)
+            if isinstance(node, ast.Attribute):
+                if not (isinstance(node.value, ast.Name) and node.value.id == "math") or node.attr.startswith("_") \
+                        or not hasattr(math, node.attr):
+                    raise CalculatorError("Unknown function '%s'" % node.attr)
+            if isinstance(node, ast.Constant) and not isinstance(node.value, (int, float, complex, str)):
+                raise CalculatorError("Unsupported constant %r" % (node.value,))
+    
+    def compile(self, expression, variables=()):
+        key = (self.normalize(expression), tuple(sorted(variables)))
+        try:
+            code = self._cache[key]
+        except KeyError:
+            pass
+        else:
+            self._cache.move_to_end(key)
+            return code
+        
+        if len(key[0]) > MAX_EXPRESSION_LENGTH:
+            raise CalculatorError("Expression too long")
+        try:
+            tree = ast.parse(key[0], mode='eval')
+        except SyntaxError as e:
+            raise CalculatorError("Syntax error: %s" % e.msg)
+        except (RecursionError, MemoryError):
+            raise CalculatorError("Expression too deeply nested")
+        self._validate(tree, key[1])
+        tree = _BudgetTransformer(key[1]).visit(tree)
+        tree = ast.fix_missing_locations(_ConstantFolder(self.namespace, key[1]).visit(tree))
+        code = compile(tree, "<calculator>", "eval")
+        self._cache[key] = code
+        while len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+        return code
+    
+    def evaluate(self, expression, variables=None, array=False):
+        variables = variables or {}
+        code = self.compile(expression, variables)
+        if array:
+            if self._array_globals is None:
+                array_math = array_math_namespace()
+                bare = {name: value for name, value in vars(array_math).items() if callable(value)}
+                self._array_globals = {**self._globals, **bare, **ARRAY_BUDGET_GUARDS, "math": array_math,
+                                       "abs": np.abs, "min": np.minimum, "max": np.maximum, "round": np.round,
+                                       "float": lambda value: np.asarray(value, dtype=np.float64), "int": np.trunc}
+            try:
+                return eval(code, self._array_globals, variables)
+            except ValueError as e:
+                # NumPy won't reduce an array to a single bool for if/else, and/or, not or chained comparisons
+                if "truth value" in str(e):
+                    raise CalculatorError("Conditions (if/else, and, or, not, a < x < b) need scalar values in array mode")
+                raise
+        result = eval(code, self._globals, variables)
+        if _is_integer(result):
+            _check_bits(result.bit_length())
+        elif isinstance(result, tuple):
+            raise CalculatorError("Tuples are only allowed as function arguments")
+        return result
+
+expression_engine = ExpressionEngine(calculator_namespace())
+
+# Modo de arrays: la misma expresión compilada se evalúa sobre arrays de NumPy, con math.* apuntando a NumPy
+NUMPY_FUNCTIONS = {
+    'asin': 'arcsin', 'acos': 'arccos', 'atan': 'arctan', 'atan2': 'arctan2',
+    'asinh': 'arcsinh', 'acosh': 'arccosh', 'atanh': 'arctanh', 'fabs': 'abs', 'pow': 'power',
+}
+
+def _array_log(x, base=None):
+    return np.log(x) if base is None else np.log(x) / np.log(base)
+
+def array_math_namespace():
+    functions = {}
+    for name in dir(math):
+        if name.startswith("_"):
+            continue
+        value = getattr(math, name)
+        if not callable(value):
+            functions[name] = value
+        elif hasattr(np, NUMPY_FUNCTIONS.get(name, name)):
+            functions[name] = getattr(np, NUMPY_FUNCTIONS.get(name, name))
+        else:
+            # No NumPy ufunc (gamma, erf, factorial...), fall back to an element-wise loop
+            functions[name] = np.vectorize(value, otypes=[float])
+    functions['log'] = _array_log
+    return types.SimpleNamespace(**functions)
+
+def _elementwise_integer(function):
+    # Array version of a guarded integer function: integral elements are passed on as ints and the results come
+    # back as floats, inf past the integer budget and nan where the function isn't defined
+    def scalar(*args):
+        if not all(float(value).is_integer() for value in args):
+            return math.nan
+        try:
+            return float(function(*(int(value) for value in args)))
+        except (CalculatorError, OverflowError):
+            return math.inf
+        except ValueError:
+            return math.nan
+    return np.vectorize(scalar, otypes=[float])
+
+ARRAY_BUDGET_GUARDS = {
+    '_guarded_factorial': _elementwise_integer(_guarded_factorial),
+    '_guarded_comb': _elementwise_integer(_guarded_comb),
+    '_guarded_perm': _elementwise_integer(_guarded_perm),
+    '_guarded_lcm': _elementwise_integer(_guarded_lcm),
+}
+
+class ArrayResult:
+    def __init__(self, variable, x, y):
+        self.variable = variable
+        self.x = x
+        self.y = np.broadcast_to(np.asarray(y, dtype=np.float64), x.shape)
+        # Computed once here, the panel shows them on every redraw
+        self.stats = self._stats()
+    
+    def _stats(self):
+        finite = self.y[np.isfinite(self.y)]
+        if not len(finite):
+            return {"count": len(self.y), "invalid": len(self.y)}
+        return {
+            "count": len(self.y),
+            "invalid": len(self.y) - len(finite),
+            "min": float(finite.min()),
+            "max": float(finite.max()),
+            "mean": float(finite.mean()),
+            "std": float(finite.std()),
+        }
+    
+    def save_csv(self, path):
+        np.savetxt(path, np.column_stack([self.x, self.y]), fmt="%.10g", delimiter=",",
+                   header="%s,result" % self.variable, comments="")
+    
+    def save_npy(self, path):
+        np.save(path, np.column_stack([self.x, self.y]))
+
+MAX_ARRAY_POINTS = 10**7
+
+def evaluate_array(expression, variable, start, stop, count):
+    if count > MAX_ARRAY_POINTS:
+        raise CalculatorError("Too many points")
+    x = np.linspace(start, stop, count)
+    with np.errstate(all='ignore'):
+        y = expression_engine.evaluate(expression, {variable: x}, array=True)
+    return ArrayResult(variable, x, y)
+
+_array_results = {}
+
+# Trazado de funciones: se evalúa una malla fina de una vez y solo se conservan las muestras que la
+# interpolación lineal no puede reproducir dentro de la tolerancia
+def adaptive_indices(curvature, tolerance):
+    # curvature[i] is the second difference at sample i; linear interpolation over m steps errs by about m^2 * curvature / 8
+    curvature = np.where(np.isfinite(curvature), curvature, np.inf).tolist()
+    keep = [0]
+    start, worst = 0, 0.0
+    for i in range(1, len(curvature) - 1):
+        worst = max(worst, curvature[i])
+        span = i + 1 - start
+        if span * span * worst > 8 * tolerance:
+            keep.append(i)
+            start, worst = i, curvature[i]
+    keep.append(len(curvature) - 1)
+    return np.array(keep)
+
+def _second_difference(values, axis):
+    values = np.moveaxis(values, axis, 0)
+    difference = np.zeros(values.shape, dtype=np.float64)
+    difference[1:-1] = np.abs(values[:-2] - 2 * values[1:-1] + values[2:])
+    return np.moveaxis(difference, 0, axis)
+
+def _tolerance(values, tolerance):
+    finite = values[np.isfinite(values)]
+    extent = float(finite.max() - finite.min()) if len(finite) else 0.0
+    return tolerance * (extent if extent > 0 else 1.0)
+
+def _evaluate_on(expression, variables, shape):
+    with np.errstate(all='ignore'):
+        values = expression_engine.evaluate(expression, variables, array=True)
+    return np.broadcast_to(np.asarray(values, dtype=np.float64), shape)
+
+def sample_curve(expression, start, stop, resolution, tolerance):
+    x = np.linspace(start, stop, resolution)
+    points = np.zeros((resolution, 3))
+    points[:, 0] = x
+    points[:, 1] = _evaluate_on(expression, {"x": x}, x.shape)
+    return _adaptive_polyline(points, tolerance)
+
+def sample_parametric(expressions, start, stop, resolution, tolerance):
+    t = np.linspace(start, stop, resolution)
+    points = np.stack([_evaluate_on(expression, {"t": t}, t.shape) if expression.strip() else np.zeros(resolution)
+                       for expression in expressions], axis=-1)
+    return _adaptive_polyline(points, tolerance)
+
+def _adaptive_polyline(points, tolerance):
+    curvature = np.linalg.norm(_second_difference(points, 0), axis=1)
+    points = points[adaptive_indices(curvature, _tolerance(points, tolerance))]
+    # Non-finite samples split the polyline instead of producing vertices at infinity
+    finite = np.all(np.isfinite(points), axis=1)
+    edges = np.flatnonzero(finite[:-1] & finite[1:])
+    edges = np.stack([edges, edges + 1], axis=-1)
+    return _compact(points, edges)
+
+def sample_surface(expression, x_range, y_range, resolution, tolerance):
+    x = np.linspace(x_range[0], x_range[1], resolution)
+    y = np.linspace(y_range[0], y_range[1], resolution)
+    z = _evaluate_on(expression, {"x": x[None, :], "y": y[:, None]}, (resolution, resolution))
+    tolerance = _tolerance(z, tolerance)
+    # Rows and columns are chosen separately, so the refined grid stays a crack-free tensor product
+    # The twist term (as in z = x * y) bends quads even where both second differences vanish
+    twist = np.zeros(z.shape)
+    twist[1:, 1:] = np.abs(z[1:, 1:] - z[1:, :-1] - z[:-1, 1:] + z[:-1, :-1])
+    finite = np.isfinite(z)
+    columns = adaptive_indices(np.maximum(_second_difference(z, 1), twist).max(axis=0, initial=0.0, where=finite), tolerance)
+    rows = adaptive_indices(np.maximum(_second_difference(z, 0), twist).max(axis=1, initial=0.0, where=finite), tolerance)
+    z = z[np.ix_(rows, columns)]
+    grid_x, grid_y = np.meshgrid(x[columns], y[rows])
+    points = np.stack([grid_x, grid_y, z], axis=-1).reshape(-1, 3)
+    
+    index = np.arange(len(points)).reshape(len(rows), len(columns))
+    quads = np.stack([index[:-1, :-1], index[:-1, 1:], index[1:, 1:], index[1:, :-1]], axis=-1).reshape(-1, 4)
+    quads = quads[np.all(np.isfinite(z.ravel()[quads]), axis=1)]
+    return _compact(points, quads)
+
+def _compact(points, elements):
+    used, remap = np.unique(elements, return_inverse=True)
+    return points[used], remap.reshape(elements.shape)
+
+def create_plot_mesh(name, points, elements):
+    mesh = bpy.data.meshes.new(name)
+    mesh.vertices.add(len(points))
+    mesh.vertices.foreach_set("co", np.ascontiguousarray(points, dtype=np.float32).ravel())
+    if elements.shape[1] == 2:
+        mesh.edges.add(len(elements))
+        mesh.edges.foreach_set("vertices", np.ascontiguousarray(elements, dtype=np.int32).ravel())
+        mesh.update()
+        return mesh
+    mesh.loops.add(elements.size)
+    mesh.loops.foreach_set("vertex_index", np.ascontiguousarray(elements, dtype=np.int32).ravel())
+    mesh.polygons.add(len(elements))
+    mesh.polygons.foreach_set("loop_start", np.arange(0, elements.size, 4, dtype=np.int32))
+    try:
+        mesh.polygons.foreach_set("loop_total", np.full(len(elements), 4, dtype=np.int32))
+    except (AttributeError, TypeError):
+        # Blender 4.0+ derives polygon sizes from loop_start
+        pass
+    mesh.update(calc_edges=True)
+    return mesh
+
+# Calculadora de atributos de malla: la expresión se evalúa una vez sobre los buffers de todos los vértices
+ATTRIBUTE_ASSIGNMENT = re.compile(r"^\s*([A-Za-z_]\w*)\s*=(?!=)(.*)$", re.S)
+MESH_VARIABLES = ("x", "y", "z", "nx", "ny", "nz", "index")
+
+def parse_assignment(text):
+    match = ATTRIBUTE_ASSIGNMENT.match(text)
+    if match is None:
+        raise CalculatorError("Use 'target = expression', e.g. z = 0.1*sin(4*x) + y**2")
+    return match.group(1), match.group(2).strip()
+
+def _vertex_buffer(mesh, name, components, dtype=np.float32):
+    buffer = np.empty(len(mesh.vertices) * components, dtype=dtype)
+    mesh.vertices.foreach_get(name, buffer)
+    return buffer.reshape(-1, components) if components > 1 else buffer
+
+def apply_mesh_expression(mesh, text, only_selected=True):
+    # Only the buffers the expression uses are read; x, y, z write back into the vertex positions,
+    # any other target becomes a float point attribute
+    target, expression = parse_assignment(text)
+    code = expression_engine.compile(expression, MESH_VARIABLES)
+    used = set(code.co_names)
+    count = len(mesh.vertices)
+    co = _vertex_buffer(mesh, "co", 3)
+    variables = {"x": co[:, 0].astype(np.float64), "y": co[:, 1].astype(np.float64), "z": co[:, 2].astype(np.float64)}
+    if used & {"nx", "ny", "nz"}:
+        normals = _vertex_buffer(mesh, "normal", 3).astype(np.float64)
+        variables.update(nx=normals[:, 0], ny=normals[:, 1], nz=normals[:, 2])
+    if "index" in used:
+        variables["index"] = np.arange(count, dtype=np.float64)
+    with np.errstate(all='ignore'):
+        values = np.broadcast_to(expression_engine.evaluate(expression, variables, array=True), (count,))
+    mask = _vertex_buffer(mesh, "select", 1, dtype=bool) if only_selected else np.ones(count, dtype=bool)
+    
+    if target in ("x", "y", "z"):
+        column = "xyz".index(target)
+        co[mask, column] = values[mask]
+        mesh.vertices.foreach_set("co", co.ravel())
+    elif target in MESH_VARIABLES:
+        raise CalculatorError("'%s' is read-only" % target)
+    else:
+        attribute = mesh.attributes.get(target)
+        if attribute is None:
+            attribute = mesh.attributes.new(target, 'FLOAT', 'POINT')
+        elif attribute.data_type != 'FLOAT' or attribute.domain != 'POINT':
+            raise CalculatorError("Attribute '%s' is not a float vertex attribute" % target)
+        data = np.zeros(count, dtype=np.float32)
+        if not mask.all():
+            attribute.data.foreach_get("value", data)
+        data[mask] = values[mask]
+        attribute.data.foreach_set("value", data)
+    mesh.update()
+    return int(mask.sum())
+
+def format_result(value):
+    # str() refuses integers past sys.int_info.str_digits_check_threshold digits (Python 3.11+)
+    try:
+        return str(value)
+    except ValueError:
+        raise CalculatorError("Result too large to display (%d bits)" % value.bit_length())
+
+def _evaluate_in_worker(connection, expression, variables):
+    try:
+        connection.send((True, expression_engine.evaluate(expression, variables)))
+    except Exception as e:
+        connection.send((False, "%s: %s" % (type(e).__name__, e)))
+    finally:
+        connection.close()
+
+def evaluate_bounded(expression, variables=None, timeout=0.0):
+    # With a timeout the expression runs in a forked worker that is killed when the time is up; the budget
+    # checks alone apply where fork isn't available. Fork is deliberate here, unlike the airfoil library
+    # preprocessing: a spawned or forkserver interpreter would have to import this module, which needs bpy, to
+    # unpickle the target. The fork happens on the main thread (operators run there), and the child only evaluates
+    # the already compiled pure-Python expression, pickles the result into the pipe and leaves through os._exit,
+    # so it never calls into bpy, NumPy or any lock another Blender thread could have been holding
+    if timeout <= 0:
+        return expression_engine.evaluate(expression, variables)
+    expression_engine.compile(expression, variables or {})
+    try:
+        context = multiprocessing.get_context('fork')
+    except ValueError:
+        return expression_engine.evaluate(expression, variables)
+    receiver, sender = context.Pipe(duplex=False)
+    worker = context.Process(target=_evaluate_in_worker, args=(sender, expression, variables), daemon=True)
+    worker.start()
+    sender.close()
+    try:
+        if not receiver.poll(timeout):
+            raise CalculatorError("Timed out after %g s" % timeout)
+        ok, value = receiver.recv()
+    except EOFError:
+        raise CalculatorError("Evaluation failed")
+    finally:
+        receiver.close()
+        if worker.is_alive():
+            worker.terminate()
+        worker.join()
+    if not ok:
+        raise CalculatorError(value)
+    return value
+
+# Unidades de las constantes anteriores
+constant_units = {
+    'c': "m/s",
+    'G': "m^3 kg^-1 s^-2",
+    'h': "J s",
+    'k': "J K^-1",
+    'Mol': "mol^-1",
+    'Gases': "J/(mol K)",
+    'Gravedad': "m/s^2",
+    'Ry': "m^-1",
+}
+
+CODATA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "codata_constants.tsv")
+
+Constant = collections.namedtuple("Constant", "name value unit description")
+
+# Registro de constantes: las listas del EnumProperty se construyen una sola vez por categoría y se
+# reutilizan en cada redibujado; la tabla CODATA se lee del archivo la primera vez que se pide
+class ConstantRegistry:
+    def __init__(self, builtin, units, codata_path):
+        self.codata_path = codata_path
+        self._constants = {}
+        self._items = {}
+        for category, values in builtin.items():
+            self._add(category, [Constant(name, value, units.get(name, ""), "") for name, value in values.items()])
+        self.categories = list(builtin) + ["CODATA"]
+    
+    def _add(self, category, entries):
+        self._constants[category] = {entry.name: entry for entry in entries}
+        self._items[category] = [
+            (entry.name, entry.name, ("%s = %.10g %s" % (entry.description or entry.name, entry.value, entry.unit)).strip())
+            for entry in entries
+        ]
+    
+    def _load_codata(self):
+        entries = []
+        try:
+            with open(self.codata_path, encoding='utf-8') as file:
+                for line in file:
+                    if not line.strip() or line.startswith("#"):
+                        continue
+                    symbol, value, unit, description = line.rstrip("\n").split("\t")
+                    entries.append(Constant(symbol, float(value), unit, description))
+        except (OSError, ValueError):
+            entries = []
+        if not entries:
+            entries = [Constant("-", float('nan'), "", "CODATA table not found")]
+        self._add("CODATA", entries)
+    
+    def _category(self, category):
+        if category not in self._items and category == "CODATA":
+            self._load_codata()
+        return category
+    
+    def enum_items(self, category):
+        return self._items[self._category(category)]
+    
+    def get(self, category, name):
+        return self._constants[self._category(category)].get(name)
+
+constant_registry = ConstantRegistry(constants, constant_units, CODATA_PATH)
+
 # Conversión entre grados y radianes
 def deg_to_rad(degrees):
     return math.radians(degrees)
@@ -83,6 +695,33 @@ class ScientificCalculatorPanel(bpy.types.Panel):
         row = col.row(align=True)
         row.operator("calculator.calculate", text="=").operator = "="
         row.operator("calculator.undo", text="Undo")
+        col.prop(context.scene, "calculator_timeout")
+
+        # Array mode
+        col.prop(context.scene, "calculator_array_mode")
+        if context.scene.calculator_array_mode:
+            row = col.row(align=True)
+            row.prop(context.scene, "array_variable", text="")
+            row.prop(context.scene, "array_start", text="From")
+            row.prop(context.scene, "array_stop", text="To")
+            row.prop(context.scene, "array_count", text="Points")
+            result = _array_results.get(context.scene.name)
+            if result is not None:
+                box = col.box()
+                for key, value in result.stats.items():
+                    box.label(text="%s: %.10g" % (key, value))
+                col.operator("calculator.export_array", text="Export Result")
+
+        row = col.row(align=True)
+        row.operator("calculator.plot", text="Plot y = f(x)").mode = 'CURVE'
+        row.operator("calculator.plot", text="Plot z = f(x, y)").mode = 'SURFACE'
+
+        col.prop(context.scene, "attribute_expression", text="")
+        row = col.row(align=True)
+        row.prop(context.scene, "attribute_only_selected", text="Selected Only")
+        op = row.operator("calculator.mesh_attribute", text="Apply to Mesh")
+        op.expression = context.scene.attribute_expression
+        op.only_selected = context.scene.attribute_only_selected
 
         # Advanced functions
         col.separator()
@@ -108,6 +747,9 @@ class ScientificCalculatorPanel(bpy.types.Panel):
         col.label(text="Constants")
         col.prop(context.scene, "constant_category", text="Category")
         col.prop(context.scene, "constant_value", text="Constant")
+        constant = constant_registry.get(context.scene.constant_category, context.scene.constant_value)
+        if constant is not None:
+            col.label(text="%.10g %s" % (constant.value, constant.unit))
 
         row = col.row(align=True)
         row.operator("calculator.constant_input", text="Use Constant")
@@ -139,11 +781,23 @@ class CalculatorCalculateOperator(bpy.types.Operator):
     operator: bpy.props.StringProperty()
 
     def execute(self, context):
-        screen = context.scene.calculator_screen
+        scene = context.scene
+        screen = scene.calculator_screen
+        if scene.calculator_array_mode:
+            try:
+                _array_results[scene.name] = evaluate_array(screen, scene.array_variable, scene.array_start,
+                                                            scene.array_stop, scene.array_count)
+            except Exception as e:
+                self.report({'ERROR'}, str(e))
+                return {'CANCELLED'}
+            return {'FINISHED'}
         try:
             # Evaluar la expresión de forma segura
-            result = eval(screen, {"__builtins__": None}, {"math": math, **constants["Math"], **constants["Physics"], **constants["Chemistry"], **constants["Other"]})
-            context.scene.calculator_screen = str(result)
+            result = evaluate_bounded(screen, timeout=context.scene.calculator_timeout)
+            context.scene.calculator_screen = format_result(result)
+        except CalculatorError as e:
+            context.scene.calculator_screen = "Error"
+            self.report({'ERROR'}, str(e))
         except Exception as e:
             context.scene.calculator_screen = "Error"
         return {'FINISHED'}
@@ -188,13 +842,134 @@ class CalculatorUndoOperator(bpy.types.Operator):
 
 def update_constant_value(self, context):
     category = context.scene.constant_category
-    constants_dict = constants[category]
-    context.scene.constant_value = str(list(constants_dict.values())[0])
+    context.scene.constant_value = constant_registry.enum_items(category)[0][0]
 
 def get_constant_items(self, context):
-    category = context.scene.constant_category
-    constants_dict = constants[category]
-    return [(str(value), const, "") for const, value in constants_dict.items()]
+    return constant_registry.enum_items(context.scene.constant_category)
+
+class CalculatorExportArrayOperator(bpy.types.Operator):
+    bl_idname = "calculator.export_array"
+    bl_label = "Export Array Result"
+    filepath: bpy.props.StringProperty(subtype='FILE_PATH', default="result.csv")
+
+    def invoke(self, context, event):
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+    def execute(self, context):
+        result = _array_results.get(context.scene.name)
+        if result is None:
+            self.report({'ERROR'}, "Evaluate an expression in array mode first")
+            return {'CANCELLED'}
+        path = bpy.path.abspath(self.filepath)
+        if path.lower().endswith(".npy"):
+            result.save_npy(path)
+        else:
+            result.save_csv(path)
+        return {'FINISHED'}
+
+class CalculatorPlotOperator(bpy.types.Operator):
+    bl_idname = "calculator.plot"
+    bl_label = "Plot Function"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    mode: bpy.props.EnumProperty(
+        name="Mode",
+        items=[
+            ('CURVE', "y = f(x)", "Plot a function of x as a curve"),
+            ('PARAMETRIC', "Parametric", "Plot x(t), y(t), z(t) as a curve"),
+            ('SURFACE', "z = f(x, y)", "Plot a function of x and y as a surface"),
+        ],
+        default='CURVE'
+    )
+    expression: bpy.props.StringProperty(name="f", default="", options={'SKIP_SAVE'})
+    expression_x: bpy.props.StringProperty(name="x(t)", default="math.cos(t)")
+    expression_y: bpy.props.StringProperty(name="y(t)", default="math.sin(t)")
+    expression_z: bpy.props.StringProperty(name="z(t)", default="t / 10")
+    start: bpy.props.FloatProperty(name="Start", default=-5.0)
+    stop: bpy.props.FloatProperty(name="Stop", default=5.0)
+    y_start: bpy.props.FloatProperty(name="Y Start", default=-5.0)
+    y_stop: bpy.props.FloatProperty(name="Y Stop", default=5.0)
+    resolution: bpy.props.IntProperty(name="Resolution", description="Samples per axis before refinement", default=1000, min=3, max=100000)
+    tolerance: bpy.props.FloatProperty(name="Tolerance", description="Allowed deviation relative to the plotted range", default=0.001, min=1e-6, max=0.1)
+
+    def invoke(self, context, event):
+        if not self.expression:
+            self.expression = context.scene.calculator_screen
+        return self.execute(context)
+
+    def execute(self, context):
+        try:
+            if self.mode == 'CURVE':
+                points, elements = sample_curve(self.expression, self.start, self.stop, self.resolution, self.tolerance)
+            elif self.mode == 'PARAMETRIC':
+                points, elements = sample_parametric((self.expression_x, self.expression_y, self.expression_z),
+                                                     self.start, self.stop, self.resolution, self.tolerance)
+            else:
+                resolution = min(self.resolution, 4000)
+                points, elements = sample_surface(self.expression, (self.start, self.stop), (self.y_start, self.y_stop),
+                                                  resolution, self.tolerance)
+        except Exception as e:
+            self.report({'ERROR'}, str(e))
+            return {'CANCELLED'}
+        if not len(elements):
+            self.report({'ERROR'}, "Nothing to plot")
+            return {'CANCELLED'}
+        
+        mesh = create_plot_mesh("Plot", points, elements)
+        obj = bpy.data.objects.new("Plot", mesh)
+        context.collection.objects.link(obj)
+        for selected in context.selected_objects:
+            selected.select_set(False)
+        obj.select_set(True)
+        context.view_layer.objects.active = obj
+        self.report({'INFO'}, "%d vertices" % len(points))
+        return {'FINISHED'}
+
+    def draw(self, context):
+        layout = self.layout
+        layout.prop(self, "mode")
+        if self.mode == 'PARAMETRIC':
+            layout.prop(self, "expression_x")
+            layout.prop(self, "expression_y")
+            layout.prop(self, "expression_z")
+        else:
+            layout.prop(self, "expression")
+        layout.prop(self, "start")
+        layout.prop(self, "stop")
+        if self.mode == 'SURFACE':
+            layout.prop(self, "y_start")
+            layout.prop(self, "y_stop")
+        layout.prop(self, "resolution")
+        layout.prop(self, "tolerance")
+
+class CalculatorMeshAttributeOperator(bpy.types.Operator):
+    bl_idname = "calculator.mesh_attribute"
+    bl_label = "Apply to Mesh"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    expression: bpy.props.StringProperty(name="Expression", default="z = 0.1*sin(4*x) + y**2")
+    only_selected: bpy.props.BoolProperty(name="Selected Vertices Only", default=True)
+
+    @classmethod
+    def poll(cls, context):
+        return context.active_object is not None and context.active_object.type == 'MESH'
+
+    def execute(self, context):
+        obj = context.active_object
+        mode = obj.mode
+        if mode == 'EDIT':
+            bpy.ops.object.mode_set(mode='OBJECT')
+        try:
+            count = apply_mesh_expression(obj.data, self.expression, self.only_selected)
+        except Exception as e:
+            self.report({'ERROR'}, str(e))
+            return {'CANCELLED'}
+        finally:
+            if mode == 'EDIT':
+                bpy.ops.object.mode_set(mode='EDIT')
+        self.report({'INFO'}, "Updated %d vertices" % count)
+        return {'FINISHED'}
 
 class ConstantInputOperator(bpy.types.Operator):
     bl_idname = "calculator.constant_input"
@@ -202,8 +977,10 @@ class ConstantInputOperator(bpy.types.Operator):
 
     def execute(self, context):
         screen = context.scene.calculator_screen
-        constant = context.scene.constant_value
-        screen += constant
+        constant = constant_registry.get(context.scene.constant_category, context.scene.constant_value)
+        if constant is None:
+            return {'CANCELLED'}
+        screen += repr(constant.value) if math.isfinite(constant.value) else "float('%r')" % constant.value
         context.scene.calculator_screen = screen
         return {'FINISHED'}
 
@@ -215,11 +992,32 @@ def register():
     bpy.utils.register_class(CalculatorRadToDegOperator)
     bpy.utils.register_class(CalculatorUndoOperator)
     bpy.utils.register_class(ConstantInputOperator)
+    bpy.utils.register_class(CalculatorExportArrayOperator)
+    bpy.utils.register_class(CalculatorPlotOperator)
+    bpy.utils.register_class(CalculatorMeshAttributeOperator)
 
     bpy.types.Scene.calculator_screen = bpy.props.StringProperty(name="Calculator Screen", default="")
+    bpy.types.Scene.calculator_timeout = bpy.props.FloatProperty(
+        name="Timeout (s)",
+        description="Evaluate in a worker process and give up after this many seconds (0 evaluates in place)",
+        default=0.0,
+        min=0.0,
+        max=60.0
+    )
+    bpy.types.Scene.calculator_array_mode = bpy.props.BoolProperty(name="Array Mode", default=False)
+    bpy.types.Scene.array_variable = bpy.props.StringProperty(name="Variable", default="x")
+    bpy.types.Scene.array_start = bpy.props.FloatProperty(name="Start", default=0.0)
+    bpy.types.Scene.array_stop = bpy.props.FloatProperty(name="Stop", default=1.0)
+    bpy.types.Scene.array_count = bpy.props.IntProperty(name="Count", default=1000, min=1, max=MAX_ARRAY_POINTS)
+    bpy.types.Scene.attribute_expression = bpy.props.StringProperty(
+        name="Mesh Expression",
+        description="target = expression over x, y, z, nx, ny, nz and index; target is x, y, z or a float attribute name",
+        default="z = 0.1*sin(4*x) + y**2"
+    )
+    bpy.types.Scene.attribute_only_selected = bpy.props.BoolProperty(name="Selected Vertices Only", default=True)
     bpy.types.Scene.constant_category = bpy.props.EnumProperty(
         name="Constant Category",
-        items=[(cat, cat, "") for cat in constants.keys()],
+        items=[(category, category, "") for category in constant_registry.categories],
         update=update_constant_value
     )
     bpy.types.Scene.constant_value = bpy.props.EnumProperty(
@@ -235,8 +1033,19 @@ def unregister():
     bpy.utils.unregister_class(CalculatorRadToDegOperator)
     bpy.utils.unregister_class(CalculatorUndoOperator)
     bpy.utils.unregister_class(ConstantInputOperator)
+    bpy.utils.unregister_class(CalculatorExportArrayOperator)
+    bpy.utils.unregister_class(CalculatorPlotOperator)
+    bpy.utils.unregister_class(CalculatorMeshAttributeOperator)
 
     del bpy.types.Scene.calculator_screen
+    del bpy.types.Scene.calculator_timeout
+    del bpy.types.Scene.calculator_array_mode
+    del bpy.types.Scene.array_variable
+    del bpy.types.Scene.array_start
+    del bpy.types.Scene.array_stop
+    del bpy.types.Scene.array_count
+    del bpy.types.Scene.attribute_expression
+    del bpy.types.Scene.attribute_only_selected
     del bpy.types.Scene.constant_category
     del bpy.types.Scene.constant_value
 
@@ -4,11 +4,26 @@ bl_info = {
     "category": "Object",
 }
 
+import argparse
 import bpy
-import bmesh
+import collections
+import concurrent.futures
+import fnmatch
+import glob
+import hashlib
+import heapq
+import json
 import math
 import numpy as np
 import os
+import re
+import sys
+import threading
+import time
+import zipfile
+
+AIRFOIL_LIBRARY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "file_dat_foil.zip")
+LIBRARY_INDEX_VERSION = 4
 
 def parse_naca_number(naca_number):
     if len(naca_number) == 4:
@@ -18,62 +33,144 @@ def parse_naca_number(naca_number):
     else:
         raise ValueError("Invalid NACA number format")
 
-def naca4_digit_airfoil(m, p, t, num_points=100):
-    x = np.linspace(0, 1, num_points)
-    yt = 5 * t * (0.2969 * np.sqrt(x) - 0.1260 * x - 0.3516 * x**2 + 0.2843 * x**3 - 0.1015 * x**4)
-    
-    yc = np.where(x <= p, m / p**2 * (2 * p * x - x**2), m / (1 - p)**2 * ((1 - 2 * p) + 2 * p * x - x**2))
-    dyc_dx = np.where(x <= p, 2 * m / p**2 * (p - x), 2 * m / (1 - p)**2 * (p - x))
-    theta = np.arctan(dyc_dx)
-    
-    xu = x - yt * np.sin(theta)
-    yu = yc + yt * np.cos(theta)
-    xl = x + yt * np.sin(theta)
-    yl = yc - yt * np.cos(theta)
+# Mean line constants of the 5-digit series, keyed by the code's 2nd-3rd digits
+NACA5_MEAN_LINES = {
+    15: (0.058, 361.4),
+    20: (0.126, 51.64),
+    25: (0.2025, 15.957),
+    30: (0.29, 6.643),
+    35: (0.391, 3.23),
+}
+
+SPACING_ITEMS = [
+    ('UNIFORM', "Uniform", "Evenly spaced chordwise stations"),
+    ('COSINE', "Cosine", "Stations clustered at the leading and trailing edges"),
+    ('HALF_COSINE', "Half Cosine", "Stations clustered at the leading edge only"),
+    ('ADAPTIVE', "Curvature Adaptive", "Stations distributed by arc length and surface curvature"),
+]
+
+def airfoil_x_distribution(num_points, spacing='UNIFORM'):
+    beta = np.linspace(0, 1, num_points)
+    if spacing == 'UNIFORM':
+        return beta
+    if spacing in ('COSINE', 'ADAPTIVE'):
+        return 0.5 * (1 - np.cos(np.pi * beta))
+    if spacing == 'HALF_COSINE':
+        return 1 - np.cos(0.5 * np.pi * beta)
+    raise ValueError("Unknown spacing: %s" % spacing)
+
+def _interp_rows(xq, xp, fp):
+    # np.interp over each row of monotonic abscissae, done as one call by shifting every row past the previous one
+    width = max(xp.max(), xq.max()) - min(xp.min(), xq.min()) + 1.0
+    offsets = width * np.arange(xp.shape[0])[:, None]
+    return np.interp(xq + offsets, (xp + offsets).ravel(), fp.ravel()).reshape(xq.shape)
+
+def redistribute_curves(points, count, curvature_weight=1.0):
+    # points is (N, K, 2); each curve keeps its end points and gets count stations placed evenly in
+    # a blend of normalized arc length and normalized turning angle, so curved regions get more points
+    segments = np.diff(points, axis=1)
+    lengths = np.hypot(segments[..., 0], segments[..., 1])
+    angles = np.unwrap(np.arctan2(segments[..., 1], segments[..., 0]), axis=1)
+    turning = np.zeros_like(lengths)
+    turning[:, 1:] += 0.5 * np.abs(np.diff(angles, axis=1))
+    turning[:, :-1] += 0.5 * np.abs(np.diff(angles, axis=1))
     
-    x_coords = np.concatenate([xu, xl[::-1]])
-    y_coords = np.concatenate([yu, yl[::-1]])
+    weights = lengths / np.maximum(lengths.sum(axis=1, keepdims=True), 1e-300)
+    weights += curvature_weight * turning / np.maximum(turning.sum(axis=1, keepdims=True), 1e-300)
+    cumulative = np.concatenate([np.zeros((len(points), 1)), np.cumsum(weights, axis=1)], axis=1)
+    cumulative /= np.maximum(cumulative[:, -1:], 1e-300)
     
-    return x_coords, y_coords
+    targets = np.broadcast_to(np.linspace(0, 1, count), (len(points), count))
+    return np.stack([_interp_rows(targets, cumulative, points[..., i]) for i in range(2)], axis=-1)
+
+def _redistribute_sections(coords, num_points):
+    # Generator layout: upper surface LE -> TE then lower surface TE -> LE, each redistributed on its own
+    half = coords.shape[1] // 2
+    upper = redistribute_curves(coords[:, :half], num_points)
+    lower = redistribute_curves(coords[:, half:], num_points)
+    return np.concatenate([upper, lower], axis=1)
+
+def naca_parameters(naca_number):
+    airfoil_type, param1, param2, param3 = parse_naca_number(naca_number)
+    if airfoil_type == "NACA4":
+        return airfoil_type, param1 / 100, param2 / 10, param3
+    return airfoil_type, param1 / 100, param2, param3
 
-def naca5_digit_airfoil(cl, p, t, num_points=100):
-    x = np.linspace(0, 1, num_points)
-    yt = 5 * t * (0.2969 * np.sqrt(x) - 0.1260 * x - 0.3516 * x**2 + 0.2843 * x**3 - 0.1015 * x**4)
-    
-    if p == 0.15:
-        m = 0.058
-        k1 = 361.4
-    elif p == 0.20:
-        m = 0.126
-        k1 = 51.64
-    elif p == 0.25:
-        m = 0.2025
-        k1 = 15.957
-    elif p == 0.30:
-        m = 0.29
-        k1 = 6.643
-    elif p == 0.35:
-        m = 0.391
-        k1 = 3.23
-    
-    yc = np.where(x < p, k1 / 6 * (x**3 - 3 * m * x**2 + m**2 * (3 - m) * x), k1 / 6 * m**3 * (1 - x))
-    dyc_dx = np.where(x < p, k1 / 6 * (3 * x**2 - 6 * m * x + m**2 * (3 - m)), -k1 / 6 * m**3)
+def _naca_thickness(t, x):
+    return 5 * t * (0.2969 * np.sqrt(x) - 0.1260 * x - 0.3516 * x**2 + 0.2843 * x**3 - 0.1015 * x**4)
+
+def _naca_contour(x, yt, yc, dyc_dx):
     theta = np.arctan(dyc_dx)
-    
     xu = x - yt * np.sin(theta)
     yu = yc + yt * np.cos(theta)
     xl = x + yt * np.sin(theta)
     yl = yc - yt * np.cos(theta)
     
-    x_coords = np.concatenate([xu, xl[::-1]])
-    y_coords = np.concatenate([yu, yl[::-1]])
+    coords = np.empty(yt.shape[:-1] + (2 * yt.shape[-1], 2))
+    coords[..., :yt.shape[-1], 0] = xu
+    coords[..., :yt.shape[-1], 1] = yu
+    coords[..., yt.shape[-1]:, 0] = xl[..., ::-1]
+    coords[..., yt.shape[-1]:, 1] = yl[..., ::-1]
+    return coords
+
+def _batch_columns(*values):
+    return [column[:, None] for column in np.broadcast_arrays(*(np.atleast_1d(np.asarray(v, dtype=np.float64)) for v in values))]
+
+def _dense_count(num_points, spacing):
+    # Curvature-adaptive sections are evaluated on a dense cosine grid, then redistributed
+    return max(8 * num_points, 400) if spacing == 'ADAPTIVE' else num_points
+
+def naca4_digit_airfoil_batch(m, p, t, num_points=100, spacing='UNIFORM'):
+    # Returns an (N, 2 * num_points, 2) array; m, p and t broadcast against each other
+    m, p, t = _batch_columns(m, p, t)
+    x = airfoil_x_distribution(_dense_count(num_points, spacing), spacing)
+    yt = _naca_thickness(t, x)
     
-    return x_coords, y_coords
+    # Symmetric sections (p = 0) have no forward mean line, so avoid dividing by zero there
+    p_fore = np.where(p > 0, p, 1.0)
+    fore = x <= p
+    yc = np.where(fore, m / p_fore**2 * (2 * p * x - x**2), m / (1 - p)**2 * ((1 - 2 * p) + 2 * p * x - x**2))
+    dyc_dx = np.where(fore, 2 * m / p_fore**2 * (p - x), 2 * m / (1 - p)**2 * (p - x))
+    coords = _naca_contour(x, yt, yc, dyc_dx)
+    return _redistribute_sections(coords, num_points) if spacing == 'ADAPTIVE' else coords
 
-def load_airfoil_from_dat(filepath):
-    with open(filepath, 'r') as file:
-        lines = file.readlines()
-        
+def naca5_digit_airfoil_batch(cl, p, t, num_points=100, spacing='UNIFORM'):
+    cl, p, t = _batch_columns(cl, p, t)
+    keys = [int(key) for key in np.rint(p[:, 0] * 100)]
+    unsupported = sorted(set(keys) - set(NACA5_MEAN_LINES))
+    if unsupported:
+        raise ValueError("Unsupported 5-digit mean line: %s" % ", ".join("%02d" % key for key in unsupported))
+    m, k1 = np.array([NACA5_MEAN_LINES[key] for key in keys]).reshape(-1, 2).T
+    m, k1 = m[:, None], k1[:, None]
+    x = airfoil_x_distribution(_dense_count(num_points, spacing), spacing)
+    yt = _naca_thickness(t, x)
+    
+    fore = x < p
+    yc = np.where(fore, k1 / 6 * (x**3 - 3 * m * x**2 + m**2 * (3 - m) * x), k1 / 6 * m**3 * (1 - x))
+    dyc_dx = np.where(fore, k1 / 6 * (3 * x**2 - 6 * m * x + m**2 * (3 - m)), -k1 / 6 * m**3)
+    coords = _naca_contour(x, yt, yc, dyc_dx)
+    return _redistribute_sections(coords, num_points) if spacing == 'ADAPTIVE' else coords
+
+def naca_airfoil_batch(naca_numbers, num_points=100, spacing='UNIFORM'):
+    # Mixed 4- and 5-digit codes are evaluated as one batch per series and returned in input order
+    params = [naca_parameters(code) for code in naca_numbers]
+    coords = np.empty((len(params), 2 * num_points, 2))
+    for airfoil_type, generator in (("NACA4", naca4_digit_airfoil_batch), ("NACA5", naca5_digit_airfoil_batch)):
+        rows = [i for i, param in enumerate(params) if param[0] == airfoil_type]
+        if rows:
+            values = np.array([params[i][1:] for i in rows]).T
+            coords[rows] = generator(*values, num_points=num_points, spacing=spacing)
+    return coords
+
+def naca4_digit_airfoil(m, p, t, num_points=100, spacing='UNIFORM'):
+    coords = naca4_digit_airfoil_batch(m, p, t, num_points, spacing)[0]
+    return coords[:, 0].copy(), coords[:, 1].copy()
+
+def naca5_digit_airfoil(cl, p, t, num_points=100, spacing='UNIFORM'):
+    coords = naca5_digit_airfoil_batch(cl, p, t, num_points, spacing)[0]
+    return coords[:, 0].copy(), coords[:, 1].copy()
+
+def _parse_dat_points_tolerant(lines):
     coords = []
     for line in lines:
         try:
@@ -81,9 +178,852 @@ def load_airfoil_from_dat(filepath):
             coords.append((x, y))
         except ValueError:
             continue
+    return np.array(coords, dtype=np.float64).reshape(-1, 2)
+
+def _is_lednicer_header(points):
+    # Lednicer files start with the upper/lower point counts, e.g. "17.  17."
+    if len(points) < 3:
+        return False
+    n_upper, n_lower = points[0]
+    if n_upper < 2 or n_lower < 2 or n_upper != int(n_upper) or n_lower != int(n_lower):
+        return False
+    return int(n_upper) + int(n_lower) == len(points) - 1
+
+def parse_airfoil_dat(data):
+    if isinstance(data, bytes):
+        data = data.decode('latin-1')
+    lines = data.splitlines()
+    
+    # Skip the description line, if any, then convert the whole body in one call
+    start = 0
+    while start < len(lines) and not lines[start].strip():
+        start += 1
+    if start < len(lines):
+        try:
+            x, y = map(float, lines[start].split())
+        except ValueError:
+            start += 1
+    body = lines[start:]
+    try:
+        points = np.array(" ".join(body).split(), dtype=np.float64).reshape(-1, 2)
+    except ValueError:
+        points = _parse_dat_points_tolerant(body)
+    
+    if _is_lednicer_header(points):
+        # Lednicer lists both surfaces from the leading edge; reorder to Selig (TE -> upper -> LE -> lower -> TE)
+        n_upper = int(points[0, 0])
+        upper = points[1:1 + n_upper]
+        lower = points[1 + n_upper:]
+        if np.array_equal(upper[0], lower[0]):
+            lower = lower[1:]
+        points = np.concatenate([upper[::-1], lower])
+    
+    if len(points) == 0:
+        raise ValueError("No coordinates found in DAT data")
+    points = np.ascontiguousarray(points.T)
+    return points[0], points[1]
+
+def airfoil_cache_dir():
+    return bpy.utils.user_resource('DATAFILES', path="airfoil_cache", create=True)
+
+def _cached_dat_path(key):
+    directory = os.path.join(airfoil_cache_dir(), "dat")
+    os.makedirs(directory, exist_ok=True)
+    return os.path.join(directory, key + ".npy")
+
+def _load_cached_dat(key, data_func):
+    # Parsed contours are stored as a (2, n) array so the x and y rows stay contiguous when memory-mapped
+    path = _cached_dat_path(key)
+    try:
+        points = np.load(path, mmap_mode='r')
+        return points[0], points[1]
+    except (OSError, ValueError):
+        pass
+    x_coords, y_coords = parse_airfoil_dat(data_func())
+    tmp_path = path + ".tmp.npy"
+    np.save(tmp_path, np.stack([x_coords, y_coords]))
+    os.replace(tmp_path, path)
+    return x_coords, y_coords
+
+def load_airfoil_from_dat(filepath, use_cache=True):
+    with open(filepath, 'rb') as file:
+        data = file.read()
+    if not use_cache:
+        return parse_airfoil_dat(data)
+    return _load_cached_dat(hashlib.sha1(data).hexdigest(), lambda: data)
+
+def _dat_description(lines):
+    for line in lines:
+        line = line.strip()
+        if line:
+            return line
+    return ""
+
+def _library_dat_members(archive):
+    return [info.filename for info in archive.infolist()
+            if not info.is_dir() and info.filename.lower().endswith(".dat")]
+
+def _library_sections(archive, num_points=100):
+    # Yields (member, text, preprocess_airfoil result) for every parseable member
+    for member in _library_dat_members(archive):
+        member, text, section = _preprocess_library_member(archive, member, num_points)
+        if section is not None:
+            yield member, text, section
+
+def build_library_index(archive_path=AIRFOIL_LIBRARY_PATH, num_points=100):
+    # Reads the packed output of the preprocess operator when it is current, otherwise parses the archive
+    try:
+        packed = load_preprocessed_library(num_points, archive_path)
+    except (OSError, ValueError, KeyError):
+        packed = None
+    if packed is not None:
+        members = list(zip(packed["names"].tolist(), packed["descriptions"].tolist(), packed["points"].tolist()))
+        descriptors = packed["descriptors"]
+    else:
+        members = []
+        sections = []
+        le_radii = []
+        with zipfile.ZipFile(archive_path) as archive:
+            for name, data, (coords, le_radius, points) in _library_sections(archive, num_points):
+                members.append((name, _dat_description(data.splitlines()), points))
+                sections.append(coords)
+                le_radii.append(le_radius)
+        descriptors = airfoil_descriptors_batch(np.array(sections).reshape(-1, 2 * num_points, 2))
+        descriptors[:, DESCRIPTOR_NAMES.index("le_radius")] = le_radii
     
-    x_coords, y_coords = zip(*coords)
-    return np.array(x_coords), np.array(y_coords)
+    entries = []
+    for (name, description, points), values in zip(members, descriptors.tolist()):
+        entry = {"name": name, "description": description, "points": points}
+        entry.update(zip(DESCRIPTOR_NAMES, values))
+        entries.append(entry)
+    return entries
+
+_library_indexes = {}
+
+def _archive_stamp(archive_path):
+    stat = os.stat(archive_path)
+    return [stat.st_size, stat.st_mtime_ns]
+
+def _library_index_path(archive_path):
+    key = hashlib.sha1(archive_path.encode('utf-8')).hexdigest()[:16]
+    return os.path.join(airfoil_cache_dir(), "library_%s.json" % key)
+
+def airfoil_library_index(archive_path=AIRFOIL_LIBRARY_PATH):
+    archive_path = os.path.abspath(archive_path)
+    stamp = _archive_stamp(archive_path)
+    cached = _library_indexes.get(archive_path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    
+    index_path = _library_index_path(archive_path)
+    entries = None
+    try:
+        with open(index_path, 'r') as file:
+            data = json.load(file)
+        if data.get("version") == LIBRARY_INDEX_VERSION and data.get("stamp") == stamp:
+            entries = data["entries"]
+    except (OSError, ValueError, KeyError):
+        pass
+    
+    if entries is None:
+        entries = build_library_index(archive_path)
+        tmp_path = index_path + ".tmp"
+        with open(tmp_path, 'w') as file:
+            json.dump({"version": LIBRARY_INDEX_VERSION, "stamp": stamp, "entries": entries}, file)
+        os.replace(tmp_path, index_path)
+    
+    _library_indexes[archive_path] = (stamp, entries)
+    return entries
+
+def read_library_member(archive, member, use_cache=True):
+    info = archive.getinfo(member)
+    if not use_cache:
+        return parse_airfoil_dat(archive.read(info))
+    # The member CRC is read from the central directory, so cache hits never decompress
+    key = "zip_%08x_%d" % (info.CRC, info.file_size)
+    return _load_cached_dat(key, lambda: archive.read(info))
+
+def load_airfoil_from_library(member, archive_path=AIRFOIL_LIBRARY_PATH, use_cache=True):
+    with zipfile.ZipFile(archive_path) as archive:
+        return read_library_member(archive, member, use_cache)
+
+def normalize_airfoil(x_coords, y_coords):
+    # Move the leading edge to the origin and rotate/scale so the trailing edge midpoint lands on (1, 0)
+    le = int(np.argmin(x_coords))
+    te_x = 0.5 * (x_coords[0] + x_coords[-1])
+    te_y = 0.5 * (y_coords[0] + y_coords[-1])
+    dx = te_x - x_coords[le]
+    dy = te_y - y_coords[le]
+    chord = math.hypot(dx, dy)
+    if chord == 0:
+        raise ValueError("Contour has zero chord")
+    cos_a, sin_a = dx / chord, dy / chord
+    px = x_coords - x_coords[le]
+    py = y_coords - y_coords[le]
+    return (px * cos_a + py * sin_a) / chord, (py * cos_a - px * sin_a) / chord
+
+def close_trailing_edge(x_coords, y_coords):
+    # Blend each surface linearly in x so both trailing edge points meet at (1, 0) and the nose is untouched
+    le = int(np.argmin(x_coords))
+    x_coords = np.array(x_coords, dtype=np.float64)
+    y_coords = np.array(y_coords, dtype=np.float64)
+    for surface, end in ((slice(0, le + 1), 0), (slice(le + 1, None), -1)):
+        weight = x_coords[surface] / x_coords[end] if x_coords[end] else 0.0
+        x_coords[surface] += weight * (1.0 - x_coords[end])
+        y_coords[surface] -= weight * y_coords[end]
+    return x_coords, y_coords
+
+def resample_airfoil(x_coords, y_coords, num_points=100, spacing='COSINE'):
+    # Returns the generator layout: upper surface LE -> TE, then lower surface TE -> LE
+    le = int(np.argmin(x_coords))
+    if le == 0 or le == len(x_coords) - 1:
+        raise ValueError("Contour has no leading edge between its surfaces")
+    x_le = x_coords[le]
+    x_te = max(x_coords[0], x_coords[-1])
+    grid = x_le + (x_te - x_le) * airfoil_x_distribution(_dense_count(num_points, spacing), spacing)
+    surfaces = []
+    for xs, ys in ((x_coords[:le + 1], y_coords[:le + 1]), (x_coords[le:], y_coords[le:])):
+        order = np.argsort(xs, kind='stable')
+        surfaces.append(np.interp(grid, xs[order], ys[order]))
+    if surfaces[0].mean() < surfaces[1].mean():
+        surfaces.reverse()
+    y_upper, y_lower = surfaces
+    x_coords = np.concatenate([grid, grid[::-1]])
+    y_coords = np.concatenate([y_upper, y_lower[::-1]])
+    if spacing == 'ADAPTIVE':
+        coords = _redistribute_sections(np.stack([x_coords, y_coords], axis=-1)[None], num_points)[0]
+        return coords[:, 0].copy(), coords[:, 1].copy()
+    return x_coords, y_coords
+
+DESCRIPTOR_NAMES = (
+    "area", "centroid_x", "centroid_y",
+    "thickness", "thickness_at", "camber", "camber_at",
+    "le_radius", "te_angle",
+    "ixx", "iyy", "ixy",
+)
+
+def leading_edge_radius_batch(coords, window=4):
+    # coords is (N, P, 2), closed contours in any order; returns the LE radius in chord units for each. The nose is
+    # fitted as x = c0 + c1*y + ... + c4*y**4 through the vertices around the minimum x one, and the radius is the
+    # inverse curvature of that fit at the vertex, so it only depends on the points the contour really has there
+    coords = np.asarray(coords, dtype=np.float64)
+    x, y = coords[..., 0], coords[..., 1]
+    rows = np.arange(len(coords))[:, None]
+    nose = np.argmin(x, axis=1)[:, None]
+    chord = (x.max(axis=1) - x.min(axis=1))[:, None]
+    around = (nose + np.arange(-window, window + 1)) % coords.shape[1]
+    u = (x[rows, around] - x[rows, nose]) / chord
+    v = (y[rows, around] - y[rows, nose]) / chord
+    fit = (np.linalg.pinv(v[..., None] ** np.arange(5)) @ u[..., None])[..., 0]
+    with np.errstate(divide='ignore'):
+        return (1 + fit[:, 1]**2) ** 1.5 / np.abs(2 * fit[:, 2])
+
+def airfoil_descriptors_batch(coords, samples=201):
+    # coords is (N, 2 * P, 2) in the generator layout (upper LE -> TE, lower TE -> LE); returns (N, len(DESCRIPTOR_NAMES)).
+    # Thickness, camber and their locations are fractions of the chord, the LE radius is in chord units and the TE angle
+    # is in degrees; area, centroid and second moments (about the centroid) are in the units of the coordinates
+    coords = np.asarray(coords, dtype=np.float64)
+    half = coords.shape[1] // 2
+    x, y = coords[..., 0], coords[..., 1]
+    x_next, y_next = np.roll(x, -1, axis=1), np.roll(y, -1, axis=1)
+    cross = x * y_next - x_next * y
+    
+    # Polygon area, centroid and second moments (shoelace); the orientation sign cancels out
+    area = 0.5 * cross.sum(axis=1)
+    centroid_x = ((x + x_next) * cross).sum(axis=1) / (6 * area)
+    centroid_y = ((y + y_next) * cross).sum(axis=1) / (6 * area)
+    ixx = ((y**2 + y * y_next + y_next**2) * cross).sum(axis=1) / 12 - area * centroid_y**2
+    iyy = ((x**2 + x * x_next + x_next**2) * cross).sum(axis=1) / 12 - area * centroid_x**2
+    ixy = ((x * y_next + 2 * x * y + 2 * x_next * y_next + x_next * y) * cross).sum(axis=1) / 24 - area * centroid_x * centroid_y
+    sign = np.sign(area)
+    area, ixx, iyy, ixy = area * sign, ixx * sign, iyy * sign, ixy * sign
+    
+    # Thickness and camber on a common cosine grid between the leading and trailing edges; cambered sections
+    # fold slightly back past the nose on the upper surface, so each surface is sorted by x before interpolating
+    upper = coords[:, :half]
+    lower = coords[:, half:][:, ::-1]
+    upper_sorted = np.take_along_axis(upper, np.argsort(upper[..., :1], axis=1, kind='stable'), axis=1)
+    lower_sorted = np.take_along_axis(lower, np.argsort(lower[..., :1], axis=1, kind='stable'), axis=1)
+    x_le = np.minimum(upper[:, 0, 0], lower[:, 0, 0])[:, None]
+    x_te = np.maximum(upper[:, -1, 0], lower[:, -1, 0])[:, None]
+    chord = x_te - x_le
+    grid = x_le + chord * 0.5 * (1 - np.cos(np.linspace(0, np.pi, samples)))
+    y_upper = _interp_rows(grid, upper_sorted[..., 0], upper_sorted[..., 1])
+    y_lower = _interp_rows(grid, lower_sorted[..., 0], lower_sorted[..., 1])
+    thickness = (y_upper - y_lower) / chord
+    camber = 0.5 * (y_upper + y_lower)
+    camber = (camber - (camber[:, :1] + (camber[:, -1:] - camber[:, :1]) * (grid - x_le) / chord)) / chord
+    rows = np.arange(len(coords))
+    it = np.argmax(thickness, axis=1)
+    ic = np.argmax(np.abs(camber), axis=1)
+    fraction = (grid - x_le) / chord
+    
+    le_radius = leading_edge_radius_batch(coords)
+    
+    # Trailing edge angle between the last upper and lower surface segments
+    upper_dir = upper[:, -1] - upper[:, -2]
+    lower_dir = lower[:, -1] - lower[:, -2]
+    cos_te = (upper_dir * lower_dir).sum(axis=1) / (np.linalg.norm(upper_dir, axis=1) * np.linalg.norm(lower_dir, axis=1))
+    te_angle = np.degrees(np.arccos(np.clip(cos_te, -1, 1)))
+    
+    return np.stack([
+        area, centroid_x, centroid_y,
+        thickness[rows, it], fraction[rows, it], camber[rows, ic], fraction[rows, ic],
+        le_radius, te_angle,
+        ixx, iyy, ixy,
+    ], axis=1)
+
+def airfoil_descriptors(x_coords, y_coords, num_points=200):
+    # Contours that start at the trailing edge (Selig .dat files) are resampled to the generator layout first;
+    # the LE radius always comes from the original points, resampling flattens the nose into chords
+    le_radius = leading_edge_radius_batch(np.stack([x_coords, y_coords], axis=-1)[None])[0]
+    x_min, x_max = np.min(x_coords), np.max(x_coords)
+    if x_coords[0] - x_min > x_max - x_coords[0]:
+        x_coords, y_coords = resample_airfoil(x_coords, y_coords, num_points)
+    values = airfoil_descriptors_batch(np.stack([x_coords, y_coords], axis=-1)[None])[0]
+    values[DESCRIPTOR_NAMES.index("le_radius")] = le_radius
+    return dict(zip(DESCRIPTOR_NAMES, values.tolist()))
+
+def preprocess_airfoil(data, num_points=100):
+    # Returns (generator-layout coords, LE radius from the original points, original point count)
+    x_coords, y_coords = parse_airfoil_dat(data)
+    points = len(x_coords)
+    x_coords, y_coords = normalize_airfoil(x_coords, y_coords)
+    x_coords, y_coords = close_trailing_edge(x_coords, y_coords)
+    le_radius = leading_edge_radius_batch(np.stack([x_coords, y_coords], axis=-1)[None])[0]
+    x_coords, y_coords = resample_airfoil(x_coords, y_coords, num_points)
+    return np.stack([x_coords, y_coords], axis=-1), le_radius, points
+
+def _preprocess_library_member(archive, member, num_points):
+    # Safe to call from several threads on one open archive: ZipFile serializes the raw reads, and members are
+    # inflated and parsed in the calling thread
+    text = archive.read(member).decode('latin-1')
+    try:
+        return member, text, preprocess_airfoil(text, num_points)
+    except ValueError:
+        return member, text, None
+
+def _preprocess_executor(workers):
+    # Threads rather than processes: forking the multi-threaded Blender process (possibly from a worker thread)
+    # is unsafe, and spawned interpreters can't import bpy to unpickle the task. Inflating zip members and the
+    # NumPy parsing release the GIL for most of the work
+    return concurrent.futures.ThreadPoolExecutor(max(1, workers))
+
+def preprocessed_library_path(num_points=100, archive_path=AIRFOIL_LIBRARY_PATH):
+    key = hashlib.sha1(os.path.abspath(archive_path).encode('utf-8')).hexdigest()[:16]
+    return os.path.join(airfoil_cache_dir(), "library_%s_%d.npz" % (key, num_points))
+
+def preprocess_airfoil_library(archive_path=AIRFOIL_LIBRARY_PATH, num_points=100, workers=None, progress=None):
+    archive_path = os.path.abspath(archive_path)
+    stamp = _archive_stamp(archive_path)
+    names = []
+    descriptions = []
+    with zipfile.ZipFile(archive_path) as archive:
+        members = _library_dat_members(archive)
+        coords = np.empty((len(members), 2 * num_points, 2), dtype=np.float64)
+        le_radii = np.empty(len(members))
+        points = np.empty(len(members), dtype=np.int64)
+        with _preprocess_executor(workers or os.cpu_count() or 1) as executor:
+            results = executor.map(lambda member: _preprocess_library_member(archive, member, num_points), members)
+            for done, (member, text, section) in enumerate(results, 1):
+                if section is not None:
+                    coords[len(names)], le_radii[len(names)], points[len(names)] = section
+                    descriptions.append(_dat_description(text.splitlines()))
+                    names.append(member)
+                if progress is not None:
+                    progress(done, len(members))
+    
+    count = len(names)
+    descriptors = airfoil_descriptors_batch(coords[:count])
+    descriptors[:, DESCRIPTOR_NAMES.index("le_radius")] = le_radii[:count]
+    path = preprocessed_library_path(num_points, archive_path)
+    tmp_path = path + ".tmp.npz"
+    np.savez(tmp_path, names=np.array(names), descriptions=np.array(descriptions), points=points[:count],
+             coords=coords[:count], descriptors=descriptors, descriptor_names=np.array(DESCRIPTOR_NAMES),
+             stamp=np.array(stamp), version=LIBRARY_INDEX_VERSION)
+    os.replace(tmp_path, path)
+    return path
+
+def load_preprocessed_library(num_points=100, archive_path=AIRFOIL_LIBRARY_PATH):
+    with np.load(preprocessed_library_path(num_points, archive_path)) as packed:
+        if (list(packed["stamp"]) != _archive_stamp(os.path.abspath(archive_path))
+                or "version" not in packed.files or packed["version"] != LIBRARY_INDEX_VERSION):
+            raise ValueError("Preprocessed library is out of date")
+        return {name: packed[name] for name in packed.files}
+
+class AirfoilCoordinateCache:
+    # Size-bounded LRU in front of parsing, generation and DAT loading, so redo-panel re-executions are free
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = collections.OrderedDict()
+    
+    def get(self, key, compute):
+        try:
+            value = self._entries[key]
+        except KeyError:
+            self.misses += 1
+        else:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+        
+        value = tuple(np.asarray(array) for array in compute())
+        for array in value:
+            array.setflags(write=False)
+        self._entries[key] = value
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return value
+    
+    def clear(self):
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+    
+    def __len__(self):
+        return len(self._entries)
+
+airfoil_coordinate_cache = AirfoilCoordinateCache()
+
+def _resampled(x_coords, y_coords, num_points, spacing):
+    if num_points is None:
+        return x_coords, y_coords
+    return resample_airfoil(x_coords, y_coords, num_points, spacing)
+
+def naca_airfoil_coordinates(naca_number, num_points=100, spacing='UNIFORM'):
+    def compute():
+        airfoil_type, param1, param2, param3 = naca_parameters(naca_number)
+        if airfoil_type == "NACA4":
+            return naca4_digit_airfoil(param1, param2, param3, num_points, spacing)
+        return naca5_digit_airfoil(param1, param2, param3, num_points, spacing)
+    return airfoil_coordinate_cache.get(("NACA", naca_number, num_points, spacing), compute)
+
+def dat_airfoil_coordinates(filepath, num_points=None, spacing='COSINE'):
+    # Keyed by modification time so an edited file is re-read, and an unchanged one is never touched
+    filepath = os.path.abspath(filepath)
+    stat = os.stat(filepath)
+    key = ("DAT", filepath, stat.st_mtime_ns, stat.st_size, num_points, spacing if num_points else None)
+    return airfoil_coordinate_cache.get(key, lambda: _resampled(*load_airfoil_from_dat(filepath), num_points, spacing))
+
+def library_airfoil_coordinates(member, num_points=None, spacing='COSINE', archive_path=AIRFOIL_LIBRARY_PATH):
+    archive_path = os.path.abspath(archive_path)
+    key = ("LIB", archive_path, tuple(_archive_stamp(archive_path)), member, num_points, spacing if num_points else None)
+    return airfoil_coordinate_cache.get(
+        key, lambda: _resampled(*load_airfoil_from_library(member, archive_path), num_points, spacing))
+
+# EnumProperty item callbacks must keep their strings alive, so the list is built once per index
+_library_enum_items = []
+_library_enum_source = None
+
+def library_enum_items(self, context):
+    global _library_enum_items, _library_enum_source
+    try:
+        entries = airfoil_library_index()
+    except OSError:
+        return []
+    if entries is not _library_enum_source:
+        _library_enum_items = [
+            (entry["name"],
+             "%s - %s" % (entry["name"], entry["description"]),
+             "%d points, t/c %.1f%%, camber %.1f%%" % (entry["points"], entry["thickness"] * 100, entry["camber"] * 100))
+            for entry in entries
+        ]
+        _library_enum_source = entries
+    return _library_enum_items
+
+SIMILARITY_INDEX_VERSION = 2
+
+def _generator_to_selig(x_coords, y_coords):
+    # Generator layout (upper LE -> TE, lower TE -> LE) to Selig order (upper TE -> LE, lower LE -> TE)
+    half = len(x_coords) // 2
+    return (np.concatenate([x_coords[:half][::-1], x_coords[half:][::-1][1:]]),
+            np.concatenate([y_coords[:half][::-1], y_coords[half:][::-1][1:]]))
+
+def mesh_outline_loop(mesh):
+    # Local X/Y of the closed edge loop through the trailing edge (maximum X) vertex, in loop order from there,
+    # so the result reads like a Selig contour whatever order the vertices are stored in
+    count = len(mesh.vertices)
+    co = np.empty(count * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    co = co.reshape(-1, 3).astype(np.float64)
+    edges = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+    mesh.edges.foreach_get("vertices", edges)
+    neighbours = [[] for _ in range(count)]
+    for a, b in edges.reshape(-1, 2).tolist():
+        neighbours[a].append(b)
+        neighbours[b].append(a)
+    
+    start = int(np.argmax(co[:, 0]))
+    order = [start]
+    previous = -1
+    while len(order) <= count:
+        following = [v for v in neighbours[order[-1]] if v != previous]
+        if not following:
+            break
+        if following[0] == start:
+            if len(order) < 3:
+                break
+            return co[order, 0], co[order, 1]
+        previous = order[-1]
+        order.append(following[0])
+    raise ValueError("The outline is not a closed edge loop")
+
+def airfoil_shape_vector(x_coords, y_coords, num_points=64):
+    # Fixed-length shape signature: normalized surface heights on a shared cosine grid
+    x_coords = np.asarray(x_coords, dtype=np.float64)
+    y_coords = np.asarray(y_coords, dtype=np.float64)
+    x_min, x_max = np.min(x_coords), np.max(x_coords)
+    if x_coords[0] - x_min < x_max - x_coords[0]:
+        x_coords, y_coords = _generator_to_selig(x_coords, y_coords)
+    return resample_airfoil(*normalize_airfoil(x_coords, y_coords), num_points)[1]
+
+class ShapeKDTree:
+    # Array-backed k-d tree; nodes are stored in flat arrays so the tree saves and loads as plain .npz data
+    def __init__(self, points, leaf_size=16):
+        self.points = np.ascontiguousarray(points, dtype=np.float64)
+        order = np.arange(len(self.points))
+        dims, splits, children, ranges = [], [], [], []
+        
+        def build(start, stop):
+            node = len(dims)
+            dims.append(-1)
+            splits.append(0.0)
+            children.append((-1, -1))
+            ranges.append((start, stop))
+            if stop - start > leaf_size:
+                subset = self.points[order[start:stop]]
+                dim = int(np.argmax(subset.max(axis=0) - subset.min(axis=0)))
+                middle = (stop - start) // 2
+                part = np.argpartition(subset[:, dim], middle)
+                order[start:stop] = order[start:stop][part]
+                dims[node] = dim
+                splits[node] = float(self.points[order[start + middle], dim])
+                children[node] = (build(start, start + middle), build(start + middle, stop))
+            return node
+        
+        if len(self.points):
+            build(0, len(self.points))
+        self.order = order
+        self.dims = np.array(dims, dtype=np.int32)
+        self.splits = np.array(splits, dtype=np.float64)
+        self.children = np.array(children, dtype=np.int32).reshape(-1, 2)
+        self.ranges = np.array(ranges, dtype=np.int32).reshape(-1, 2)
+    
+    @classmethod
+    def from_arrays(cls, points, order, dims, splits, children, ranges):
+        tree = cls.__new__(cls)
+        tree.points, tree.order, tree.dims = points, order, dims
+        tree.splits, tree.children, tree.ranges = splits, children, ranges
+        return tree
+    
+    def arrays(self):
+        return {"points": self.points, "order": self.order, "dims": self.dims,
+                "splits": self.splits, "children": self.children, "ranges": self.ranges}
+    
+    def query(self, point, k=5):
+        # Returns (distances, indices) of the k nearest points, nearest first
+        point = np.asarray(point, dtype=np.float64)
+        best = []
+        pending = [(0.0, 0)] if len(self.dims) else []
+        while pending:
+            bound, node = heapq.heappop(pending)
+            if len(best) == k and bound >= -best[0][0]:
+                break
+            dim = self.dims[node]
+            if dim < 0:
+                start, stop = self.ranges[node]
+                indices = self.order[start:stop]
+                distances = np.sqrt(((self.points[indices] - point) ** 2).sum(axis=1))
+                for distance, index in zip(distances.tolist(), indices.tolist()):
+                    if len(best) < k:
+                        heapq.heappush(best, (-distance, index))
+                    elif distance < -best[0][0]:
+                        heapq.heapreplace(best, (-distance, index))
+                continue
+            offset = point[dim] - self.splits[node]
+            near, far = self.children[node] if offset < 0 else self.children[node][::-1]
+            heapq.heappush(pending, (bound, int(near)))
+            heapq.heappush(pending, (max(bound, abs(offset)), int(far)))
+        best.sort(reverse=True)
+        return np.array([-distance for distance, index in best]), np.array([index for distance, index in best], dtype=np.int64)
+
+class AirfoilSimilarityIndex:
+    def __init__(self, names, mean, components, tree, num_points):
+        self.names = names
+        self.mean = mean
+        self.components = components
+        self.tree = tree
+        self.num_points = num_points
+    
+    @classmethod
+    def build(cls, archive_path=AIRFOIL_LIBRARY_PATH, num_points=64, components=12):
+        names = []
+        vectors = []
+        with zipfile.ZipFile(archive_path) as archive:
+            for name, data, (coords, le_radius, points) in _library_sections(archive, num_points):
+                names.append(name)
+                vectors.append(coords[:, 1])
+        vectors = np.array(vectors)
+        # PCA by SVD of the centered shape vectors; components = 0 keeps the full vectors
+        mean = vectors.mean(axis=0)
+        if components:
+            basis = np.linalg.svd(vectors - mean, full_matrices=False)[2][:components]
+        else:
+            basis = np.eye(vectors.shape[1])
+        return cls(names, mean, basis, ShapeKDTree((vectors - mean) @ basis.T), num_points)
+    
+    def save(self, path):
+        tmp_path = path + ".tmp.npz"
+        np.savez(tmp_path, names=np.array(self.names), mean=self.mean, components=self.components,
+                 num_points=self.num_points, **self.tree.arrays())
+        os.replace(tmp_path, path)
+    
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            tree = ShapeKDTree.from_arrays(data["points"], data["order"], data["dims"],
+                                           data["splits"], data["children"], data["ranges"])
+            return cls(data["names"].tolist(), data["mean"], data["components"], tree, int(data["num_points"]))
+    
+    def query(self, x_coords, y_coords, k=5):
+        vector = airfoil_shape_vector(x_coords, y_coords, self.num_points)
+        distances, indices = self.tree.query((vector - self.mean) @ self.components.T, k)
+        return [(self.names[index], distance) for index, distance in zip(indices.tolist(), distances.tolist())]
+
+_similarity_indexes = {}
+
+def airfoil_similarity_index(archive_path=AIRFOIL_LIBRARY_PATH):
+    archive_path = os.path.abspath(archive_path)
+    stamp = _archive_stamp(archive_path)
+    cached = _similarity_indexes.get(archive_path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    
+    key = hashlib.sha1(("%s|%s|%d" % (archive_path, stamp, SIMILARITY_INDEX_VERSION)).encode('utf-8')).hexdigest()[:16]
+    path = os.path.join(airfoil_cache_dir(), "similarity_%s.npz" % key)
+    try:
+        index = AirfoilSimilarityIndex.load(path)
+    except (OSError, ValueError, KeyError):
+        index = AirfoilSimilarityIndex.build(archive_path)
+        index.save(path)
+    _similarity_indexes[archive_path] = (stamp, index)
+    return index
+
+def create_outline_mesh(name, coords):
+    # Fill closed outlines in bulk from an (N, P, 2 or 3) array; per-element bmesh calls dominate for dense sections
+    sections, count = coords.shape[:2]
+    co = np.zeros((sections, count, 3), dtype=np.float32)
+    co[..., :coords.shape[2]] = coords
+    indices = np.arange(sections * count, dtype=np.int32).reshape(sections, count)
+    edges = np.stack([indices, np.roll(indices, -1, axis=1)], axis=-1)
+    
+    mesh = bpy.data.meshes.new(name)
+    mesh.vertices.add(sections * count)
+    mesh.vertices.foreach_set("co", co.ravel())
+    mesh.edges.add(sections * count)
+    mesh.edges.foreach_set("vertices", edges.ravel())
+    # Ensure only edges are colored
+    mesh.edges.foreach_set("use_freestyle_mark", np.ones(sections * count, dtype=bool))
+    mesh.update()
+    return mesh
+
+AIRFOIL_DESCRIPTORS_KEY = "airfoil_section"
+
+def create_airfoil_mesh(name, x_coords, y_coords):
+    mesh = create_outline_mesh(name, np.stack([x_coords, y_coords], axis=-1)[None])
+    try:
+        mesh[AIRFOIL_DESCRIPTORS_KEY] = airfoil_descriptors(x_coords, y_coords)
+    except ValueError:
+        pass
+    return mesh
+
+AIRFOIL_HASH_KEY = "airfoil_hash"
+AIRFOIL_GEOMETRY_KEY = "airfoil_geometry"
+AIRFOIL_COLOR_KEY = "airfoil_color"
+
+def airfoil_content_hash(*arrays):
+    digest = hashlib.sha1()
+    for array in arrays:
+        array = np.ascontiguousarray(array)
+        digest.update(str((array.dtype.str, array.shape)).encode('utf-8'))
+        digest.update(array.tobytes())
+    return digest.hexdigest()
+
+_mesh_registry = {}
+_material_registry = {}
+_scanned_registries = set()
+
+def _rescan(registry, collection, prop):
+    registry.clear()
+    for datablock in collection:
+        tag = datablock.get(prop)
+        if tag is not None:
+            registry[tag] = datablock.name
+    _scanned_registries.add(id(registry))
+
+def _registered(registry, collection, prop, key):
+    # Misses on a scanned registry are trusted, new datablocks are added by their creators; the collection is
+    # only rescanned on first use, after file loads and undo, or when a cached name no longer carries its tag
+    name = registry.get(key)
+    if name is not None:
+        datablock = collection.get(name)
+        if datablock is not None and datablock.get(prop) == key:
+            return datablock
+    elif id(registry) in _scanned_registries:
+        return None
+    _rescan(registry, collection, prop)
+    return collection.get(registry.get(key, ""))
+
+@bpy.app.handlers.persistent
+def _invalidate_registries(*args):
+    _mesh_registry.clear()
+    _material_registry.clear()
+    _scanned_registries.clear()
+
+def _geometry_hash(mesh):
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    return airfoil_content_hash(co)
+
+def airfoil_mesh(name, key, build):
+    # Content-addressed mesh datablocks: identical geometry is shared by every object that uses it
+    mesh = _registered(_mesh_registry, bpy.data.meshes, AIRFOIL_HASH_KEY, key)
+    if mesh is not None and mesh.get(AIRFOIL_GEOMETRY_KEY) != _geometry_hash(mesh):
+        # Edited since it was generated: it keeps its shape but no longer stands for these inputs
+        del mesh[AIRFOIL_HASH_KEY]
+        if AIRFOIL_GEOMETRY_KEY in mesh:
+            del mesh[AIRFOIL_GEOMETRY_KEY]
+        _mesh_registry.pop(key, None)
+        mesh = None
+    if mesh is None:
+        mesh = build(name)
+        mesh[AIRFOIL_HASH_KEY] = key
+        mesh[AIRFOIL_GEOMETRY_KEY] = _geometry_hash(mesh)
+        _mesh_registry[key] = mesh.name
+    return mesh
+
+def airfoil_material(color):
+    key = "%.4f,%.4f,%.4f" % tuple(color)
+    mat = _registered(_material_registry, bpy.data.materials, AIRFOIL_COLOR_KEY, key)
+    if mat is None:
+        mat = bpy.data.materials.new(name="AirfoilMaterial")
+        mat.use_nodes = True
+        bsdf = mat.node_tree.nodes["Principled BSDF"]
+        bsdf.inputs['Emission'].default_value = (*color, 1)
+        mat[AIRFOIL_COLOR_KEY] = key
+        _material_registry[key] = mat.name
+    return mat
+
+def assign_airfoil_material(obj, color):
+    # Shared meshes keep a single slot; the color is linked per object so instances can differ
+    mat = airfoil_material(color)
+    if not obj.data.materials:
+        obj.data.materials.append(mat)
+    slot = obj.material_slots[0]
+    slot.link = 'OBJECT'
+    slot.material = mat
+
+def purge_unused_airfoil_data():
+    meshes = [mesh for mesh in bpy.data.meshes if AIRFOIL_HASH_KEY in mesh and mesh.users == 0]
+    for mesh in meshes:
+        bpy.data.meshes.remove(mesh)
+    materials = [mat for mat in bpy.data.materials if AIRFOIL_COLOR_KEY in mat and mat.users == 0]
+    for mat in materials:
+        bpy.data.materials.remove(mat)
+    _invalidate_registries()
+    return len(meshes), len(materials)
+
+def create_polygon_mesh(name, vertices, loop_vertices, loop_starts, loop_totals):
+    mesh = bpy.data.meshes.new(name)
+    mesh.vertices.add(len(vertices))
+    mesh.vertices.foreach_set("co", np.ascontiguousarray(vertices, dtype=np.float32).ravel())
+    mesh.loops.add(len(loop_vertices))
+    mesh.loops.foreach_set("vertex_index", np.ascontiguousarray(loop_vertices, dtype=np.int32))
+    mesh.polygons.add(len(loop_starts))
+    mesh.polygons.foreach_set("loop_start", np.ascontiguousarray(loop_starts, dtype=np.int32))
+    try:
+        mesh.polygons.foreach_set("loop_total", np.ascontiguousarray(loop_totals, dtype=np.int32))
+    except (AttributeError, TypeError):
+        # Blender 4.0+ derives polygon sizes from loop_start
+        pass
+    mesh.update(calc_edges=True)
+    return mesh
+
+def airfoil_section(spec, num_points=100, spacing='COSINE'):
+    # A NACA code, a .dat file path or a library member; returns the (2 * num_points - 1, 2) closed loop
+    # with chord 1 and the leading edge at the origin (the duplicate leading edge point is dropped)
+    if spec.lower().endswith(".dat"):
+        if os.path.isfile(spec):
+            x_coords, y_coords = dat_airfoil_coordinates(spec)
+        else:
+            x_coords, y_coords = library_airfoil_coordinates(spec)
+        x_coords, y_coords = normalize_airfoil(x_coords, y_coords)
+        x_coords, y_coords = resample_airfoil(x_coords, y_coords, num_points, spacing)
+    else:
+        x_coords, y_coords = naca_airfoil_coordinates(spec, num_points, spacing)
+    return np.stack([x_coords, y_coords], axis=-1)[:-1]
+
+def parse_wing_stations(text):
+    # "0:2412, 0.5:4412, 1:0012" -> [(0.0, "2412"), (0.5, "4412"), (1.0, "0012")]
+    stations = []
+    for item in text.split(","):
+        if not item.strip():
+            continue
+        eta, _, spec = item.partition(":")
+        try:
+            eta = float(eta)
+        except ValueError:
+            eta = None
+        if eta is None or not spec.strip():
+            raise ValueError("Invalid wing station '%s', expected span_fraction:section" % item.strip())
+        stations.append((eta, spec.strip()))
+    stations.sort(key=lambda station: station[0])
+    if len({eta for eta, _ in stations}) != len(stations):
+        raise ValueError("Wing stations must have distinct span fractions")
+    if len(stations) < 2 or stations[0][0] != 0 or stations[-1][0] != 1:
+        raise ValueError("Wing stations must include span fractions 0 and 1")
+    return stations
+
+def loft_wing(sections, etas, span=5.0, root_chord=1.0, taper=1.0, twist_root=0.0, twist_tip=0.0,
+              sweep=0.0, dihedral=0.0, span_stations=50, cap_ends=True):
+    # sections is (K, P, 2) defined at the K increasing span fractions in etas; returns the vertex and
+    # polygon arrays of the skinned wing, built without any per-station Python loop
+    sections = np.asarray(sections, dtype=np.float64)
+    etas = np.asarray(etas, dtype=np.float64)
+    eta = np.linspace(0, 1, span_stations)
+    upper = np.clip(np.searchsorted(etas, eta, side='right'), 1, len(etas) - 1)
+    weight = ((eta - etas[upper - 1]) / (etas[upper] - etas[upper - 1]))[:, None, None]
+    shapes = (1 - weight) * sections[upper - 1] + weight * sections[upper]
+    
+    chord = root_chord * (1 + (taper - 1) * eta)[:, None]
+    twist = np.radians(twist_root + (twist_tip - twist_root) * eta)[:, None]
+    # Twist (nose up positive) about the quarter chord, in the chord/thickness plane
+    dx = (shapes[..., 0] - 0.25) * chord
+    dz = shapes[..., 1] * chord
+    x = 0.25 * chord + dx * np.cos(twist) + dz * np.sin(twist)
+    z = -dx * np.sin(twist) + dz * np.cos(twist)
+    
+    station_y = eta * span * math.cos(math.radians(dihedral))
+    station_z = eta * span * math.sin(math.radians(dihedral))
+    x += (eta * span * math.tan(math.radians(sweep)))[:, None]
+    z += station_z[:, None]
+    y = np.broadcast_to(station_y[:, None], x.shape)
+    vertices = np.stack([x, y, z], axis=-1).reshape(-1, 3)
+    
+    count = shapes.shape[1]
+    grid = np.arange(span_stations * count, dtype=np.int32).reshape(span_stations, count)
+    following = np.roll(grid, -1, axis=1)
+    quads = np.stack([grid[:-1], following[:-1], following[1:], grid[1:]], axis=-1).reshape(-1, 4)
+    loop_vertices = [quads.ravel()]
+    loop_totals = [np.full(len(quads), 4, dtype=np.int32)]
+    if cap_ends:
+        loop_vertices += [grid[0, ::-1], grid[-1]]
+        loop_totals.append(np.array([count, count], dtype=np.int32))
+    loop_totals = np.concatenate(loop_totals)
+    loop_starts = np.concatenate([[0], np.cumsum(loop_totals)[:-1]]).astype(np.int32)
+    return vertices, np.concatenate(loop_vertices), loop_starts, loop_totals
 
 class NACA_Airfoil_Generator(bpy.types.Operator):
     bl_idname = "mesh.naca_airfoil_generator"
@@ -94,75 +1034,566 @@ class NACA_Airfoil_Generator(bpy.types.Operator):
     color: bpy.props.FloatVectorProperty(name="Color", subtype='COLOR', default=[0.8, 0.2, 0.2], min=0.0, max=1.0)
     use_dat_file: bpy.props.BoolProperty(name="Use DAT File", default=False)
     filepath: bpy.props.StringProperty(name="DAT File Path", subtype='FILE_PATH')
+    use_library: bpy.props.BoolProperty(name="Use Airfoil Library", default=False)
+    library_member: bpy.props.StringProperty(name="Library Airfoil", default="")
+    num_points: bpy.props.IntProperty(name="Points per Surface", default=100, min=3, max=100000)
+    spacing: bpy.props.EnumProperty(name="Spacing", items=SPACING_ITEMS, default='UNIFORM')
+    resample_dat: bpy.props.BoolProperty(
+        name="Resample DAT Contour",
+        description="Redistribute loaded contours to the point count and spacing above",
+        default=False,
+    )
 
     def execute(self, context):
-        if self.use_dat_file:
+        resample_points = self.num_points if self.resample_dat else None
+        if self.use_library:
+            try:
+                x_coords, y_coords = library_airfoil_coordinates(self.library_member, resample_points, self.spacing)
+            except (OSError, KeyError, ValueError) as e:
+                self.report({'ERROR'}, str(e))
+                return {'CANCELLED'}
+        elif self.use_dat_file:
             if not os.path.isfile(self.filepath):
                 self.report({'ERROR'}, "DAT file not found")
                 return {'CANCELLED'}
             try:
-                x_coords, y_coords = load_airfoil_from_dat(self.filepath)
+                x_coords, y_coords = dat_airfoil_coordinates(self.filepath, resample_points, self.spacing)
             except Exception as e:
                 self.report({'ERROR'}, str(e))
                 return {'CANCELLED'}
         else:
             try:
-                airfoil_type, param1, param2, param3 = parse_naca_number(self.naca_number)
-                if airfoil_type == "NACA4":
-                    x_coords, y_coords = naca4_digit_airfoil(param1 / 100, param2 / 10, param3)
-                else:
-                    x_coords, y_coords = naca5_digit_airfoil(param1 / 100, param2, param3)
+                x_coords, y_coords = naca_airfoil_coordinates(self.naca_number, self.num_points, self.spacing)
             except ValueError as e:
                 self.report({'ERROR'}, str(e))
                 return {'CANCELLED'}
         
-        mesh = bpy.data.meshes.new("NACA_Airfoil")
-        bm = bmesh.new()
-        
-        verts = [bm.verts.new((x, y, 0)) for x, y in zip(x_coords, y_coords)]
-        bm.verts.ensure_lookup_table()
-        for i in range(len(verts) - 1):
-            bm.edges.new([verts[i], verts[i + 1]])
-        bm.edges.new([verts[-1], verts[0]])
-        
-        bm.to_mesh(mesh)
-        bm.free()
-        
+        mesh = airfoil_mesh("NACA_Airfoil", airfoil_content_hash(x_coords, y_coords),
+                            lambda name: create_airfoil_mesh(name, x_coords, y_coords))
         obj = bpy.data.objects.new("NACA_Airfoil", mesh)
         context.collection.objects.link(obj)
         
-        mat = bpy.data.materials.new(name="AirfoilMaterial")
-        mat.use_nodes = True
-        bsdf = mat.node_tree.nodes["Principled BSDF"]
-        bsdf.inputs['Emission'].default_value = (*self.color, 1)
-        obj.data.materials.append(mat)
+        assign_airfoil_material(obj, self.color)
         
-        # Ensure only edges are colored
-        for edge in obj.data.edges:
-            edge.use_freestyle_mark = True
+        return {'FINISHED'}
+    
+    def draw(self, context):
+        layout = self.layout
+        layout.prop(self, "use_library")
+        if self.use_library:
+            layout.prop(self, "library_member")
+        else:
+            layout.prop(self, "use_dat_file")
+            if self.use_dat_file:
+                layout.prop(self, "filepath", text="DAT File Path")
+            else:
+                layout.prop(self, "naca_number")
+        if self.use_library or self.use_dat_file:
+            layout.prop(self, "resample_dat")
+        layout.prop(self, "num_points")
+        layout.prop(self, "spacing")
+        layout.prop(self, "color", text="Edge Color")
+        cache = airfoil_coordinate_cache
+        layout.label(text="Coordinate cache: %d hits, %d misses, %d/%d entries" % (cache.hits, cache.misses, len(cache), cache.maxsize))
+
+def _split_values(text):
+    return [value for value in text.replace(",", " ").split() if value]
+
+class NACA_Family_Generator(bpy.types.Operator):
+    """Generate a family of NACA sections in one vectorized pass"""
+    bl_idname = "mesh.naca_family_generator"
+    bl_label = "NACA Airfoil Family"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    mode: bpy.props.EnumProperty(
+        name="Mode",
+        items=[
+            ('CODES', "Codes", "List of 4- and 5-digit NACA codes"),
+            ('GRID', "4-Digit Grid", "Every combination of the listed camber, position and thickness digits"),
+        ],
+        default='CODES',
+    )
+    naca_numbers: bpy.props.StringProperty(name="NACA Numbers", default="0012, 2412, 4412, 23012")
+    camber_values: bpy.props.StringProperty(name="Max Camber (%)", default="0, 2, 4")
+    position_values: bpy.props.StringProperty(name="Camber Position (1/10)", default="4")
+    thickness_values: bpy.props.StringProperty(name="Thickness (%)", default="09, 12, 15")
+    layout_mode: bpy.props.EnumProperty(
+        name="Layout",
+        items=[
+            ('MESH', "Single Mesh", "All sections in one mesh object"),
+            ('COLLECTION', "Collection", "One object per section in a new collection"),
+        ],
+        default='MESH',
+    )
+    offset: bpy.props.FloatProperty(name="Offset", default=0.3, min=0.0)
+    num_points: bpy.props.IntProperty(name="Points per Surface", default=100, min=3, max=100000)
+    spacing: bpy.props.EnumProperty(name="Spacing", items=SPACING_ITEMS, default='UNIFORM')
+    color: bpy.props.FloatVectorProperty(name="Color", subtype='COLOR', default=[0.8, 0.2, 0.2], min=0.0, max=1.0)
+    
+    def execute(self, context):
+        try:
+            if self.mode == 'CODES':
+                names = _split_values(self.naca_numbers)
+                coords = naca_airfoil_batch(names, self.num_points, self.spacing)
+            else:
+                m, p, t = np.meshgrid(*(np.array(_split_values(values), dtype=np.float64) for values in
+                                        (self.camber_values, self.position_values, self.thickness_values)), indexing='ij')
+                names = ["%d%d%02d" % values for values in zip(m.ravel(), p.ravel(), t.ravel())]
+                coords = naca4_digit_airfoil_batch(m.ravel() / 100, p.ravel() / 10, t.ravel() / 100,
+                                                   self.num_points, self.spacing)
+        except ValueError as e:
+            self.report({'ERROR'}, str(e))
+            return {'CANCELLED'}
+        if not names:
+            self.report({'ERROR'}, "No NACA sections given")
+            return {'CANCELLED'}
+        
+        if self.layout_mode == 'MESH':
+            # Stack the sections along Y
+            coords = np.concatenate([coords, np.zeros(coords.shape[:2] + (1,))], axis=-1)
+            coords[..., 1] += self.offset * np.arange(len(names))[:, None]
+            mesh = airfoil_mesh("NACA_Family", airfoil_content_hash(coords), lambda name: create_outline_mesh(name, coords))
+            obj = bpy.data.objects.new("NACA_Family", mesh)
+            context.collection.objects.link(obj)
+            assign_airfoil_material(obj, self.color)
+        else:
+            collection = bpy.data.collections.new("NACA_Family")
+            context.collection.children.link(collection)
+            for i, (name, section) in enumerate(zip(names, coords)):
+                mesh = airfoil_mesh("NACA_" + name, airfoil_content_hash(section),
+                                    lambda mesh_name: create_airfoil_mesh(mesh_name, section[:, 0], section[:, 1]))
+                obj = bpy.data.objects.new("NACA_" + name, mesh)
+                obj.location.y = self.offset * i
+                collection.objects.link(obj)
+                assign_airfoil_material(obj, self.color)
         
         return {'FINISHED'}
     
     def draw(self, context):
         layout = self.layout
-        layout.prop(self, "use_dat_file")
-        if self.use_dat_file:
-            layout.prop(self, "filepath", text="DAT File Path")
+        layout.prop(self, "mode")
+        if self.mode == 'CODES':
+            layout.prop(self, "naca_numbers")
         else:
-            layout.prop(self, "naca_number")
+            layout.prop(self, "camber_values")
+            layout.prop(self, "position_values")
+            layout.prop(self, "thickness_values")
+        layout.prop(self, "layout_mode")
+        layout.prop(self, "offset")
+        layout.prop(self, "num_points")
+        layout.prop(self, "spacing")
+        layout.prop(self, "color", text="Edge Color")
+
+class Airfoil_Wing_Generator(bpy.types.Operator):
+    """Loft a wing from root and tip sections or a list of span stations"""
+    bl_idname = "mesh.airfoil_wing_generator"
+    bl_label = "Airfoil Wing"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    use_stations: bpy.props.BoolProperty(name="Use Span Stations", default=False)
+    root_section: bpy.props.StringProperty(name="Root Section", description="NACA code or library .dat", default="2412")
+    tip_section: bpy.props.StringProperty(name="Tip Section", description="NACA code or library .dat", default="0012")
+    stations: bpy.props.StringProperty(
+        name="Stations",
+        description="Comma separated span fraction:section pairs, e.g. 0:2412, 0.5:4412, 1:ag03.dat",
+        default="0:2412, 0.5:4412, 1:0012",
+    )
+    span: bpy.props.FloatProperty(name="Span", default=5.0, min=0.0, unit='LENGTH')
+    root_chord: bpy.props.FloatProperty(name="Root Chord", default=1.0, min=0.0, unit='LENGTH')
+    taper: bpy.props.FloatProperty(name="Taper Ratio", default=0.5, min=0.0)
+    twist_root: bpy.props.FloatProperty(name="Root Twist (deg)", default=0.0)
+    twist_tip: bpy.props.FloatProperty(name="Tip Twist (deg)", default=-3.0)
+    sweep: bpy.props.FloatProperty(name="LE Sweep (deg)", default=10.0, min=-80.0, max=80.0)
+    dihedral: bpy.props.FloatProperty(name="Dihedral (deg)", default=3.0, min=-80.0, max=80.0)
+    span_stations: bpy.props.IntProperty(name="Span Stations", default=50, min=2, max=10000)
+    num_points: bpy.props.IntProperty(name="Points per Surface", default=100, min=3, max=100000)
+    spacing: bpy.props.EnumProperty(name="Spacing", items=SPACING_ITEMS, default='COSINE')
+    cap_ends: bpy.props.BoolProperty(name="Cap Ends", default=True)
+    color: bpy.props.FloatVectorProperty(name="Color", subtype='COLOR', default=[0.8, 0.2, 0.2], min=0.0, max=1.0)
+    
+    def execute(self, context):
+        try:
+            if self.use_stations:
+                stations = parse_wing_stations(self.stations)
+            else:
+                stations = [(0.0, self.root_section.strip()), (1.0, self.tip_section.strip())]
+            sections = [airfoil_section(spec, self.num_points, self.spacing) for eta, spec in stations]
+            wing = loft_wing(sections, [eta for eta, spec in stations], self.span, self.root_chord, self.taper,
+                             self.twist_root, self.twist_tip, self.sweep, self.dihedral, self.span_stations, self.cap_ends)
+        except (OSError, KeyError, ValueError) as e:
+            self.report({'ERROR'}, str(e))
+            return {'CANCELLED'}
+        
+        mesh = airfoil_mesh("Airfoil_Wing", airfoil_content_hash(*wing), lambda name: create_polygon_mesh(name, *wing))
+        obj = bpy.data.objects.new("Airfoil_Wing", mesh)
+        context.collection.objects.link(obj)
+        assign_airfoil_material(obj, self.color)
+        return {'FINISHED'}
+    
+    def draw(self, context):
+        layout = self.layout
+        layout.prop(self, "use_stations")
+        if self.use_stations:
+            layout.prop(self, "stations")
+        else:
+            layout.prop(self, "root_section")
+            layout.prop(self, "tip_section")
+        col = layout.column(align=True)
+        col.prop(self, "span")
+        col.prop(self, "root_chord")
+        col.prop(self, "taper")
+        col = layout.column(align=True)
+        col.prop(self, "twist_root")
+        col.prop(self, "twist_tip")
+        col.prop(self, "sweep")
+        col.prop(self, "dihedral")
+        col = layout.column(align=True)
+        col.prop(self, "span_stations")
+        col.prop(self, "num_points")
+        col.prop(self, "spacing")
+        layout.prop(self, "cap_ends")
         layout.prop(self, "color", text="Edge Color")
 
+class AirfoilSimilarSearch(bpy.types.Operator):
+    """Find the library airfoils most similar to a NACA section, a DAT file or the active outline"""
+    bl_idname = "mesh.airfoil_similar_search"
+    bl_label = "Find Similar Airfoils"
+    
+    source: bpy.props.EnumProperty(
+        name="Source",
+        items=[
+            ('NACA', "NACA Number", "Generate the query from a NACA code"),
+            ('DAT', "DAT File", "Load the query from a DAT file"),
+            ('OBJECT', "Active Object", "Use the outline of the active mesh (local X/Y)"),
+        ],
+        default='NACA',
+    )
+    naca_number: bpy.props.StringProperty(name="NACA Number", default="2412")
+    filepath: bpy.props.StringProperty(name="DAT File Path", subtype='FILE_PATH')
+    count: bpy.props.IntProperty(name="Results", default=8, min=1, max=100)
+    
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+    
+    def execute(self, context):
+        try:
+            if self.source == 'NACA':
+                x_coords, y_coords = naca_airfoil_coordinates(self.naca_number, 200, 'COSINE')
+            elif self.source == 'DAT':
+                x_coords, y_coords = dat_airfoil_coordinates(self.filepath)
+            else:
+                obj = context.active_object
+                if obj is None or obj.type != 'MESH' or len(obj.data.vertices) < 3:
+                    self.report({'ERROR'}, "Select a mesh outline")
+                    return {'CANCELLED'}
+                x_coords, y_coords = mesh_outline_loop(obj.data)
+            results = airfoil_similarity_index().query(x_coords, y_coords, self.count)
+        except (OSError, KeyError, ValueError) as e:
+            self.report({'ERROR'}, str(e))
+            return {'CANCELLED'}
+        
+        def draw(menu, context):
+            for name, distance in results:
+                props = menu.layout.operator(NACA_Airfoil_Generator.bl_idname, text="%s  (%.4f)" % (name, distance))
+                props.use_library = True
+                props.library_member = name
+        
+        context.window_manager.popup_menu(draw, title="Similar Airfoils")
+        return {'FINISHED'}
+    
+    def draw(self, context):
+        layout = self.layout
+        layout.prop(self, "source")
+        if self.source == 'NACA':
+            layout.prop(self, "naca_number")
+        elif self.source == 'DAT':
+            layout.prop(self, "filepath")
+        layout.prop(self, "count")
+
+class AirfoilPurgeUnused(bpy.types.Operator):
+    """Remove airfoil meshes and materials that no object uses anymore"""
+    bl_idname = "mesh.airfoil_purge_unused"
+    bl_label = "Purge Unused Airfoil Data"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    def execute(self, context):
+        meshes, materials = purge_unused_airfoil_data()
+        self.report({'INFO'}, "Removed %d airfoil meshes and %d materials" % (meshes, materials))
+        return {'FINISHED'}
+
+class AirfoilLibrarySearch(bpy.types.Operator):
+    """Search the airfoil library and add the chosen section"""
+    bl_idname = "mesh.airfoil_library_search"
+    bl_label = "Airfoil from Library"
+    bl_property = "airfoil"
+    
+    airfoil: bpy.props.EnumProperty(name="Airfoil", items=library_enum_items)
+    
+    def invoke(self, context, event):
+        context.window_manager.invoke_search_popup(self)
+        return {'RUNNING_MODAL'}
+    
+    def execute(self, context):
+        return bpy.ops.mesh.naca_airfoil_generator('EXEC_DEFAULT', use_library=True, library_member=self.airfoil)
+
+class AirfoilLibraryPreprocess(bpy.types.Operator):
+    """Parse, normalize and resample every airfoil in the library in background worker threads"""
+    bl_idname = "mesh.airfoil_library_preprocess"
+    bl_label = "Preprocess Airfoil Library"
+    
+    num_points: bpy.props.IntProperty(name="Points per Surface", default=100, min=10, max=10000)
+    workers: bpy.props.IntProperty(name="Workers", description="Worker threads, 0 uses every core", default=0, min=0)
+    
+    _timer = None
+    _thread = None
+    _state = None
+    
+    def execute(self, context):
+        state = self._state = {"done": 0, "total": 0, "path": None, "error": None}
+        
+        def progress(done, total):
+            state["done"], state["total"] = done, total
+        
+        def run(num_points, workers):
+            try:
+                state["path"] = preprocess_airfoil_library(num_points=num_points, workers=workers, progress=progress)
+            except Exception as e:
+                state["error"] = str(e)
+        
+        self._thread = threading.Thread(target=run, args=(self.num_points, self.workers or None), daemon=True)
+        self._thread.start()
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(0.2, window=context.window)
+        wm.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+    
+    def modal(self, context, event):
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+        state = self._state
+        if self._thread.is_alive():
+            context.workspace.status_text_set("Preprocessing airfoils: %d / %d" % (state["done"], state["total"]))
+            return {'RUNNING_MODAL'}
+        
+        context.window_manager.event_timer_remove(self._timer)
+        context.workspace.status_text_set(None)
+        if state["error"]:
+            self.report({'ERROR'}, state["error"])
+            return {'CANCELLED'}
+        self.report({'INFO'}, "Preprocessed library written to %s" % state["path"])
+        return {'FINISHED'}
+
+DESCRIPTOR_LABELS = (
+    ("thickness", "Max Thickness", "%.2f%% c", 100),
+    ("thickness_at", "  at", "%.1f%% c", 100),
+    ("camber", "Max Camber", "%.2f%% c", 100),
+    ("camber_at", "  at", "%.1f%% c", 100),
+    ("le_radius", "LE Radius", "%.4f c", 1),
+    ("te_angle", "TE Angle", "%.2f\u00b0", 1),
+    ("area", "Area", "%.5g", 1),
+    ("centroid_x", "Centroid X", "%.4f", 1),
+    ("centroid_y", "Centroid Y", "%.4f", 1),
+    ("ixx", "Ixx", "%.4g", 1),
+    ("iyy", "Iyy", "%.4g", 1),
+    ("ixy", "Ixy", "%.4g", 1),
+)
+
+class AirfoilSectionPanel(bpy.types.Panel):
+    bl_label = "Airfoil Section"
+    bl_idname = "VIEW3D_PT_airfoil_section"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = 'Airfoil'
+    
+    @classmethod
+    def poll(cls, context):
+        obj = context.active_object
+        return obj is not None and obj.type == 'MESH' and AIRFOIL_DESCRIPTORS_KEY in obj.data
+    
+    def draw(self, context):
+        descriptors = context.active_object.data[AIRFOIL_DESCRIPTORS_KEY]
+        col = self.layout.column(align=True)
+        for key, label, fmt, scale in DESCRIPTOR_LABELS:
+            if key in descriptors:
+                row = col.row()
+                row.label(text=label)
+                row.label(text=fmt % (descriptors[key] * scale))
+
 def menu_func(self, context):
     self.layout.operator(NACA_Airfoil_Generator.bl_idname)
+    self.layout.operator(NACA_Family_Generator.bl_idname)
+    self.layout.operator(Airfoil_Wing_Generator.bl_idname)
+    self.layout.operator(AirfoilLibrarySearch.bl_idname)
+    self.layout.operator(AirfoilSimilarSearch.bl_idname)
+    self.layout.operator(AirfoilLibraryPreprocess.bl_idname)
+    self.layout.operator(AirfoilPurgeUnused.bl_idname)
 
 def register():
     bpy.utils.register_class(NACA_Airfoil_Generator)
+    bpy.utils.register_class(NACA_Family_Generator)
+    bpy.utils.register_class(Airfoil_Wing_Generator)
+    bpy.utils.register_class(AirfoilLibrarySearch)
+    bpy.utils.register_class(AirfoilLibraryPreprocess)
+    bpy.utils.register_class(AirfoilSimilarSearch)
+    bpy.utils.register_class(AirfoilPurgeUnused)
+    bpy.utils.register_class(AirfoilSectionPanel)
     bpy.types.VIEW3D_MT_mesh_add.append(menu_func)
+    bpy.app.handlers.load_post.append(_invalidate_registries)
+    bpy.app.handlers.undo_post.append(_invalidate_registries)
+    bpy.app.handlers.redo_post.append(_invalidate_registries)
 
 def unregister():
     bpy.utils.unregister_class(NACA_Airfoil_Generator)
+    bpy.utils.unregister_class(NACA_Family_Generator)
+    bpy.utils.unregister_class(Airfoil_Wing_Generator)
+    bpy.utils.unregister_class(AirfoilLibrarySearch)
+    bpy.utils.unregister_class(AirfoilLibraryPreprocess)
+    bpy.utils.unregister_class(AirfoilSimilarSearch)
+    bpy.utils.unregister_class(AirfoilPurgeUnused)
+    bpy.utils.unregister_class(AirfoilSectionPanel)
     bpy.types.VIEW3D_MT_mesh_add.remove(menu_func)
+    bpy.app.handlers.load_post.remove(_invalidate_registries)
+    bpy.app.handlers.undo_post.remove(_invalidate_registries)
+    bpy.app.handlers.redo_post.remove(_invalidate_registries)
+
+EXPORT_FORMATS = ("csv", "npy", "dxf", "svg", "mesh")
+
+def write_airfoil_csv(path, coords):
+    np.savetxt(path, coords, fmt="%.8f", delimiter=",", header="x,y", comments="")
+
+def write_airfoil_npy(path, coords):
+    np.save(path, np.ascontiguousarray(coords, dtype=np.float64))
+
+def write_airfoil_dxf(path, coords):
+    # Minimal R12 DXF: one closed POLYLINE in the entities section
+    vertices = "".join("0\nVERTEX\n8\n0\n10\n%.8f\n20\n%.8f\n30\n0.0\n" % (x, y) for x, y in coords.tolist())
+    with open(path, 'w') as file:
+        file.write("0\nSECTION\n2\nENTITIES\n0\nPOLYLINE\n8\n0\n66\n1\n70\n1\n")
+        file.write(vertices)
+        file.write("0\nSEQEND\n0\nENDSEC\n0\nEOF\n")
+
+def write_airfoil_svg(path, coords, scale=1000.0):
+    # SVG has Y pointing down, so the outline is flipped and scaled to millimetres of a unit chord
+    points = coords * np.array([scale, -scale])
+    low = points.min(axis=0)
+    size = points.max(axis=0) - low
+    path_data = "M " + " L ".join("%.4f %.4f" % (x, y) for x, y in (points - low).tolist()) + " Z"
+    with open(path, 'w') as file:
+        file.write('<svg xmlns="http://www.w3.org/2000/svg" width="%.4fmm" height="%.4fmm" viewBox="0 0 %.4f %.4f">\n'
+                   % (size[0], size[1], size[0], size[1]))
+        file.write('<path d="%s" fill="none" stroke="black" stroke-width="0.5"/>\n</svg>\n' % path_data)
+
+_EXPORT_WRITERS = {
+    "csv": write_airfoil_csv,
+    "npy": write_airfoil_npy,
+    "dxf": write_airfoil_dxf,
+    "svg": write_airfoil_svg,
+}
+
+def _batch_sources(codes, pattern, archive_path=AIRFOIL_LIBRARY_PATH):
+    sources = [("NACA", code) for code in codes]
+    if pattern:
+        files = sorted(glob.glob(pattern))
+        if files:
+            sources += [("DAT", path) for path in files]
+        else:
+            with zipfile.ZipFile(archive_path) as archive:
+                sources += [("LIB", name) for name in sorted(archive.namelist()) if fnmatch.fnmatch(name, pattern)]
+    return sources
+
+def _batch_chunk(chunk, num_points, spacing, resample, archive):
+    # NACA codes in a chunk are generated in one vectorized call; DAT sections are loaded one by one
+    sections = []
+    codes = [name for kind, name in chunk if kind == "NACA"]
+    generated = iter(naca_airfoil_batch(codes, num_points, spacing)) if codes else iter(())
+    for kind, name in chunk:
+        if kind == "NACA":
+            sections.append(("NACA" + name, next(generated)))
+            continue
+        if kind == "DAT":
+            x_coords, y_coords = load_airfoil_from_dat(name)
+        else:
+            x_coords, y_coords = read_library_member(archive, name)
+        if resample:
+            x_coords, y_coords = resample_airfoil(x_coords, y_coords, num_points, spacing)
+        sections.append((os.path.splitext(os.path.basename(name))[0], np.stack([x_coords, y_coords], axis=-1)))
+    return sections
+
+def batch_export(output_dir, codes=(), pattern=None, formats=("csv",), num_points=100, spacing='COSINE',
+                 resample=False, chunk_size=256, progress=None):
+    unknown = set(formats) - set(EXPORT_FORMATS)
+    if unknown:
+        raise ValueError("Unknown export formats: %s" % ", ".join(sorted(unknown)))
+    os.makedirs(output_dir, exist_ok=True)
+    sources = _batch_sources(codes, pattern)
+    collection = bpy.context.scene.collection if "mesh" in formats else None
+    
+    archive = zipfile.ZipFile(AIRFOIL_LIBRARY_PATH) if any(kind == "LIB" for kind, name in sources) else None
+    exported = 0
+    failed = []
+    start = time.perf_counter()
+    for offset in range(0, len(sources), chunk_size):
+        chunk = sources[offset:offset + chunk_size]
+        try:
+            sections = _batch_chunk(chunk, num_points, spacing, resample, archive)
+        except (OSError, KeyError, ValueError):
+            # Retry the chunk one section at a time so a single bad input does not drop its neighbours
+            sections = []
+            for source in chunk:
+                try:
+                    sections += _batch_chunk([source], num_points, spacing, resample, archive)
+                except (OSError, KeyError, ValueError) as e:
+                    # str() of a KeyError is the repr of its argument
+                    failed.append((source[1], str(e.args[0]) if isinstance(e, KeyError) and e.args else str(e)))
+        
+        for name, coords in sections:
+            stem = os.path.join(output_dir, re.sub(r"[^\w.-]+", "_", name))
+            for fmt in formats:
+                if fmt in _EXPORT_WRITERS:
+                    _EXPORT_WRITERS[fmt]("%s.%s" % (stem, fmt), coords)
+            if collection is not None:
+                mesh = airfoil_mesh(name, airfoil_content_hash(coords),
+                                    lambda mesh_name: create_airfoil_mesh(mesh_name, coords[:, 0], coords[:, 1]))
+                collection.objects.link(bpy.data.objects.new(name, mesh))
+        exported += len(sections)
+        if progress is not None:
+            progress(offset + len(chunk), len(sources), exported, time.perf_counter() - start)
+    if archive is not None:
+        archive.close()
+    return exported, failed
+
+def _print_progress(done, total, exported, elapsed):
+    print("airfoil batch: %d/%d inputs, %d exported, %.1f sections/s"
+          % (done, total, exported, exported / elapsed if elapsed else 0.0), flush=True)
+
+def main(argv):
+    # blender -b --python naca_airfoil_generator.py -- --codes 0012,2412 --glob "naca*.dat" --formats csv,svg -o out
+    parser = argparse.ArgumentParser(prog="naca_airfoil_generator.py", description="Batch export airfoil sections")
+    parser.add_argument("--codes", default="", help="comma separated NACA codes")
+    parser.add_argument("--glob", dest="pattern", help="glob over .dat files on disk, or over members of the airfoil library")
+    parser.add_argument("-o", "--output", required=True, help="output directory")
+    parser.add_argument("--formats", default="csv", help="comma separated subset of %s" % ",".join(EXPORT_FORMATS))
+    parser.add_argument("--num-points", type=int, default=100)
+    parser.add_argument("--spacing", default='COSINE', choices=[item[0] for item in SPACING_ITEMS])
+    parser.add_argument("--resample", action="store_true", help="resample DAT sections to --num-points")
+    parser.add_argument("--chunk-size", type=int, default=256)
+    parser.add_argument("--blend", help="save the generated meshes to this .blend file")
+    args = parser.parse_args(argv)
+    
+    codes = [code for code in args.codes.replace(",", " ").split() if code]
+    formats = [fmt.strip().lower() for fmt in args.formats.split(",") if fmt.strip()]
+    if not codes and not args.pattern:
+        parser.error("nothing to export, give --codes and/or --glob")
+    exported, failed = batch_export(args.output, codes, args.pattern, formats, args.num_points, args.spacing,
+                                    args.resample, args.chunk_size, _print_progress)
+    for name, error in failed:
+        print("airfoil batch: skipped %s: %s" % (name, error), file=sys.stderr)
+    if args.blend and "mesh" in formats:
+        bpy.ops.wm.save_as_mainfile(filepath=os.path.abspath(args.blend))
+    return 1 if failed else 0
 
 if __name__ == "__main__":
+    if "--" in sys.argv:
+        sys.exit(main(sys.argv[sys.argv.index("--") + 1:]))
     register()
 
@@ -0,0 +1,28 @@
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("bpy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+import calculadoracientifica as calculator
+
+
+@pytest.mark.parametrize("expression, expected", [
+    ("factorial(x)", [1, 1, 2, 6, 24, 120]),
+    ("math.factorial(x)", [1, 1, 2, 6, 24, 120]),
+    ("comb(x, 2)", [0, 0, 1, 3, 6, 10]),
+    ("perm(x, 2)", [0, 0, 2, 6, 12, 20]),
+    ("float(x) + 1", [1, 2, 3, 4, 5, 6]),
+])
+def test_array_mode_integer_functions(expression, expected):
+    result = calculator.evaluate_array(expression, "x", 0, 5, 6)
+    np.testing.assert_array_equal(result.y, expected)
+
+
+def test_array_mode_conditions_report_a_clear_error():
+    with pytest.raises(calculator.CalculatorError, match="array mode"):
+        calculator.evaluate_array("1 if x > 2 else 0", "x", 0, 5, 6)
@@ -0,0 +1,25 @@
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("bpy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import naca_airfoil_generator as generator
+
+
+def test_cambered_cosine_section_descriptors():
+    x_coords, y_coords = generator.naca_airfoil_coordinates("2412", 100, 'COSINE')
+    descriptors = generator.airfoil_descriptors(x_coords, y_coords)
+    assert descriptors["camber"] == pytest.approx(0.02, abs=2e-4)
+    assert descriptors["camber_at"] == pytest.approx(0.4, abs=0.01)
+    assert descriptors["thickness"] == pytest.approx(0.12, abs=2e-4)
+
+
+def test_leading_edge_radius_uses_contour_points():
+    # NACA 4-digit sections have r = 1.1019 t^2
+    x_coords, y_coords = generator.naca_airfoil_coordinates("0012", 100, 'COSINE')
+    assert generator.airfoil_descriptors(x_coords, y_coords)["le_radius"] == pytest.approx(0.0159, rel=0.05)
+    selig = generator._generator_to_selig(x_coords, y_coords)
+    assert generator.airfoil_descriptors(*selig)["le_radius"] == pytest.approx(0.0159, rel=0.05)